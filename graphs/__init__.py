@@ -0,0 +1,64 @@
+"""Graph data structures and algorithms.
+
+The submodules are imported on first access, so 'import graphs' stays cheap and a worker
+only pays for the algorithms it uses, e.g. 'graphs.dijkstra_algorithm.shortest_path_tree'.
+No submodule reads stdin or prints on import, the demos run with 'python -m graphs.<module>'.
+"""
+from importlib import import_module
+
+_SUBMODULES = frozenset({
+    'adjacency',
+    'avl_tree',
+    'basic_tree',
+    'bellman_ford',
+    'binary_tree',
+    'contraction_hierarchy',
+    'csr_graph',
+    'dag',
+    'dijkstra_algorithm',
+    'dijkstra_benchmark',
+    'disjoint_set',
+    'dynamic_shortest_paths',
+    'floyd_algorithm',
+    'floyd_parallel',
+    'graph_implementation',
+    'graph_io',
+    'indexed_heap',
+    'johnson',
+    'kruskal',
+    'path_cache',
+    'point_to_point',
+    'prim',
+    'traversal',
+    'weighted_graph',
+})
+
+
+def __getattr__(name: str):
+    """Imports a submodule the first time it is accessed as an attribute of the package."""
+    if name in _SUBMODULES:
+        return import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _SUBMODULES)
+
+
+def test_import_budget():
+    """Importing every submodule in a fresh interpreter with stdin closed must be quiet and fast."""
+    import subprocess
+    import sys
+    import time
+    from pathlib import Path
+
+    lazy = "import sys, graphs; assert not [m for m in sys.modules if m.startswith('graphs.')]"
+    eager = "import graphs; " + "; ".join(f"graphs.{name}" for name in sorted(_SUBMODULES))
+    for code, budget in ((lazy, 0.5), (eager, 5.0)):
+        begin = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parent.parent,
+                                stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=60)
+        elapsed = time.perf_counter() - begin
+        assert result.returncode == 0, result.stderr
+        assert result.stdout == "" and result.stderr == ""
+        assert elapsed < budget, f"Importing took {elapsed:.2f} s, the budget is {budget} s."
@@ -0,0 +1,265 @@
+"""Batch command line interface for the graph algorithms.
+
+The graph file is loaded once and every query is answered in the same process
+(or in one process pool), so a million queries cost one process start.
+The results are written as newline-delimited JSON, unreachable distances as 'null'.
+A query that cannot be answered is written as a record with an 'error' field and the
+remaining queries are still answered. Negative weights are allowed as long as they do not form
+a negative cycle, which an undirected negative edge always does.
+
+    python -m graphs sssp roads.csv --queries queries.txt --processes 4 > answers.ndjson
+    python -m graphs apsp roads.csrg --method johnson -o all_pairs.ndjson
+    python -m graphs mst roads.tsv --algorithm kruskal
+"""
+import argparse
+import json
+import sys
+from array import array
+from itertools import islice
+from math import isinf
+
+from .bellman_ford import NegativeCycleError, spfa
+from .csr_graph import CSRGraph
+from .dijkstra_algorithm import batch_shortest_paths, query_pool
+from .graph_io import load_binary, load_edge_file
+from .johnson import _all_pairs_line, all_pairs_shortest_paths
+from .kruskal import kruskal
+from .prim import boruvka, prim
+
+BINARY_SUFFIXES = ('.csrg', '.bin')
+
+
+def load_graph(path: str, directed: bool = False) -> CSRGraph:
+    """Loads a binary graph file or a CSV/TSV edge list, chosen by the file extension.
+
+    Args:
+        path (str): The path to the graph file.
+        directed (bool): If False, the edges of an edge list are stored in both directions.
+
+    Returns:
+        CSRGraph: The loaded graph.
+    """
+    if path.endswith(BINARY_SUFFIXES):
+        return load_binary(path)
+    return load_edge_file(path, directed=directed)
+
+
+def read_queries(numbered_lines, graph) -> list:
+    """Parses 'source target' lines, separated by whitespace or a comma, skipping empty and '#' lines.
+
+    A line that cannot be answered does not stop the batch, it becomes an error record instead.
+
+    Args:
+        numbered_lines (Iterable[tuple[int, str]]): The lines with their 1-based line numbers.
+        graph (CSRGraph): The graph the vertices are checked against.
+
+    Returns:
+        list: A (source, target) tuple for every valid query and a dictionary
+            {"line", "source", "target", "error"} for every invalid one, in line order.
+    """
+    entries = []
+    for line_number, line in numbered_lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        fields = line.replace(',', ' ').split()
+        try:
+            if len(fields) != 2:
+                raise ValueError(f"expected 'source target', got {line!r}")
+            source, target = int(fields[0]), int(fields[1])
+        except ValueError as e:
+            entries.append({"line": line_number, "source": None, "target": None, "error": str(e)})
+            continue
+
+        missing = next((v for v in (source, target) if v not in graph), None)
+        if missing is not None:
+            entries.append({"line": line_number, "source": source, "target": target,
+                            "error": f"vertex {missing} is not in the graph"})
+        else:
+            entries.append((source, target))
+    return entries
+
+
+def remove_negative_weights(graph: CSRGraph) -> tuple[CSRGraph, dict | None]:
+    """Reweights a graph with negative edges so that Dijkstra's algorithm answers it correctly.
+
+    Like in Johnson's algorithm every edge gets w'(u, v) = w(u, v) + h(u) - h(v) with the
+    SPFA potentials h, which keeps the shortest paths and makes every weight non-negative.
+    A distance of the reweighted graph is turned back with d(s, t) - h(s) + h(t).
+
+    Args:
+        graph (CSRGraph): The loaded graph.
+
+    Returns:
+        tuple: The graph and 'None' if no weight is negative, else the reweighted graph and the potentials.
+
+    Raises:
+        NegativeCycleError: If the graph contains a negative cycle.
+    """
+    weights = graph.weights
+    if not any(weight < 0 for weight in weights):
+        return graph, None
+
+    potential, _ = spfa(graph)
+    offsets, targets = graph.offsets, graph.targets
+    typecode = 'd' if getattr(weights, 'typecode', getattr(weights, 'format', None)) == 'd' else 'q'
+    reweighted = array(typecode, [0]) * len(weights)
+    for u in range(1, graph.num_vertices + 1):
+        shift = potential[u]
+        for i in range(offsets[u], offsets[u + 1]):
+            reweighted[i] = weights[i] + shift - potential[targets[i]]
+    return CSRGraph(offsets, targets, reweighted), potential
+
+
+def run_sssp(graph, args, output) -> int:
+    """Answers the (source, target) queries in batches of args.batch_size lines.
+
+    With args.processes a single process pool is started and reused for every batch.
+
+    Returns:
+        int: The number of queries written as error records.
+
+    Raises:
+        NegativeCycleError: If the graph contains a negative cycle.
+    """
+    graph, potential = remove_negative_weights(graph)
+    queries_file = sys.stdin if args.queries == '-' else open(args.queries)
+    numbered_lines = enumerate(queries_file, start=1)
+    pool = None if args.processes is None else query_pool(graph, args.processes)
+    failed = 0
+    try:
+        while True:
+            chunk = list(islice(numbered_lines, args.batch_size))
+            if not chunk:
+                break
+            entries = read_queries(chunk, graph)
+            queries = [entry for entry in entries if isinstance(entry, tuple)]
+            answers = iter(batch_shortest_paths(graph, queries, pool=pool))
+            for entry in entries:
+                if isinstance(entry, dict):
+                    failed += 1
+                    output.write(json.dumps(entry) + "\n")
+                    continue
+                dist, path = next(answers)
+                if potential is not None:
+                    dist += potential[entry[1]] - potential[entry[0]]
+                output.write(json.dumps({"source": entry[0], "target": entry[1],
+                                         "distance": _finite(dist), "path": path}) + "\n")
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        if queries_file is not sys.stdin:
+            queries_file.close()
+    return failed
+
+
+def run_apsp(graph, args, output) -> int:
+    """Writes one line with the distance and predecessor rows of every source."""
+    for source, dist_row, pred_row in all_pairs_shortest_paths(graph, args.method, args.processes):
+        output.write(_all_pairs_line(source, dist_row, pred_row))
+    return 0
+
+
+def run_mst(graph, args, output) -> int:
+    """Writes the minimum spanning tree (or forest) as a single line."""
+    if args.algorithm == 'kruskal':
+        edges, total = kruskal(graph)
+    elif args.algorithm == 'prim':
+        edges, total = prim(graph)
+    else:
+        edges, total = boruvka(graph, args.processes)
+    output.write(json.dumps({"edges": edges, "total": total}) + "\n")
+    return 0
+
+
+def _finite(value):
+    """Returns 'None' for an infinite distance, which JSON cannot represent."""
+    return None if isinf(value) else value
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Returns the argument parser of the 'sssp', 'apsp' and 'mst' commands."""
+    parser = argparse.ArgumentParser(prog="python -m graphs", description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("graph", help="a CSV/TSV edge list or a binary graph file (.csrg, .bin)")
+    common.add_argument("--directed", action="store_true", help="keep the edges of an edge list one-way")
+    common.add_argument("-o", "--output", default="-", help="the output file, '-' for stdout")
+    common.add_argument("--processes", type=int, default=None, help="the size of the worker pool")
+
+    sssp = commands.add_parser("sssp", parents=[common], help="shortest paths for (source, target) queries")
+    sssp.add_argument("--queries", default="-", help="the file of 'source target' lines, '-' for stdin")
+    sssp.add_argument("--batch-size", type=int, default=100_000, help="the queries answered per batch")
+    sssp.set_defaults(run=run_sssp)
+
+    apsp = commands.add_parser("apsp", parents=[common], help="all-pairs shortest paths")
+    apsp.add_argument("--method", choices=("auto", "johnson", "floyd"), default="auto")
+    apsp.set_defaults(run=run_apsp)
+
+    mst = commands.add_parser("mst", parents=[common], help="minimum spanning tree")
+    mst.add_argument("--algorithm", choices=("kruskal", "prim", "boruvka"), default="kruskal")
+    mst.set_defaults(run=run_mst)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    """Runs the command line interface and returns the exit status.
+
+    The status is 1 if the graph could not be loaded, contains a negative cycle,
+    or any query was written as an error record.
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        graph = load_graph(args.graph, args.directed)
+        output = sys.stdout if args.output == '-' else open(args.output, 'w')
+        try:
+            failed = args.run(graph, args, output)
+        finally:
+            if output is not sys.stdout:
+                output.close()
+    except (OSError, KeyError, ValueError, NegativeCycleError) as e:
+        print(f"python -m graphs: error: {e}", file=sys.stderr)
+        return 1
+
+    if failed:
+        print(f"python -m graphs: {failed} queries failed, see the records with an 'error' field", file=sys.stderr)
+        return 1
+    return 0
+
+
+def test_sssp_reports_bad_queries_and_continues(tmp_path):
+    (tmp_path / "graph.csv").write_text("1,2,4\n2,3,1\n")
+    (tmp_path / "queries.txt").write_text("1 3\n1 9\nfoo\n3 1\n")
+    status = main(["sssp", str(tmp_path / "graph.csv"), "--queries", str(tmp_path / "queries.txt"),
+                   "--batch-size", "2", "-o", str(tmp_path / "out.ndjson")])
+    records = [json.loads(line) for line in (tmp_path / "out.ndjson").read_text().splitlines()]
+
+    assert status == 1
+    assert records[0] == {"source": 1, "target": 3, "distance": 5, "path": [1, 2, 3]}
+    assert records[1] == {"line": 2, "source": 1, "target": 9, "error": "vertex 9 is not in the graph"}
+    assert records[2]["line"] == 3 and "error" in records[2]
+    assert records[3] == {"source": 3, "target": 1, "distance": 5, "path": [3, 2, 1]}
+
+
+def test_negative_weights(tmp_path, capsys):
+    (tmp_path / "graph.csv").write_text("1,2,4\n2,3,1\n3,4,-2\n")
+    (tmp_path / "queries.txt").write_text("1 4\n4 1\n")
+    sssp = ["sssp", str(tmp_path / "graph.csv"), "--queries", str(tmp_path / "queries.txt"),
+            "-o", str(tmp_path / "out.ndjson")]
+    apsp = ["apsp", str(tmp_path / "graph.csv"), "-o", str(tmp_path / "all_pairs.ndjson")]
+    for argv in (sssp, apsp):
+        assert main(argv) == 1
+        assert "error: The graph contains a negative cycle" in capsys.readouterr().err
+
+    status = main(sssp + ["--directed"])
+    records = [json.loads(line) for line in (tmp_path / "out.ndjson").read_text().splitlines()]
+    assert status == 0
+    assert records == [{"source": 1, "target": 4, "distance": 3, "path": [1, 2, 3, 4]},
+                       {"source": 4, "target": 1, "distance": None, "path": []}]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+from collections.abc import Mapping
+
+
+class _NeighbourDictView(Mapping):
+    """Presents a mapping of vertex -> {neighbour: weight} as vertex -> (neighbour, weight) pairs."""
+    def __init__(self, adj_dict: dict) -> None:
+        self.adj_dict = adj_dict
+
+    def __getitem__(self, vertex):
+        return self.adj_dict[vertex].items()
+
+    def __contains__(self, vertex) -> bool:
+        return vertex in self.adj_dict
+
+    def __iter__(self):
+        return iter(self.adj_dict)
+
+    def __len__(self) -> int:
+        return len(self.adj_dict)
+
+
+def as_adjacency(graph) -> Mapping:
+    """Returns the graph as a mapping from a vertex to an iterable of (neighbour, weight) pairs.
+
+    The weighted graphs in this package keep their edges in different shapes:
+    - 'weighted_graph.WeightedGraph' and the 'kruskal' input: vertex -> {neighbour: weight},
+    - 'graph_implementation.WeightedGraph': vertex -> [(neighbour, weight), ...],
+    - 'CSRGraph': already a mapping to (neighbour, weight) pairs.
+    This function hides the difference so the algorithms only deal with pairs.
+
+    Args:
+        graph: A weighted graph object with a 'graph' attribute, or the adjacency mapping itself.
+
+    Returns:
+        Mapping: The vertex -> (neighbour, weight) pairs view of the graph.
+    """
+    adj_list = getattr(graph, 'graph', graph)
+    if isinstance(adj_list, dict) and isinstance(next(iter(adj_list.values()), None), dict):
+        return _NeighbourDictView(adj_list)
+    return adj_list
@@ -1,11 +1,7 @@
+from collections.abc import Iterable
 from typing import Any, Optional
 
 
-class MaxChildrenError(Exception):
-    """Raised when trying to add more than two children to a binary tree node."""
-    pass
-
-
 class Stack:
     def __init__(self):
         self.stack = []
@@ -37,33 +33,23 @@ class Stack:
 
 class AVLNode:
     """Represents a node in the AVL tree."""
-    def __init__(self, AVLNode_id: int, data: Any, parent: 'AVLNode' = None):
-        """Creates a new node in the AVL tree.
+    def __init__(self, key: Any, data: Any = None):
+        """Creates a new leaf node in the AVL tree.
 
-        This method initializes a new node in the AVL tree with the given data, sets its unique ID.
-        Sets the parent reference if provided. By default, both left and right children
-        are set to 'None'.
-        Additionally, the node's level in the AVL tree is determined:
-        - The root node has a level of 0.
-        - Any other node's level is one more than its parent's level.
+        The node stores its own height and the number of nodes in its subtree, so the balance
+        and the rank of a node are known in O(1) instead of being recomputed from its whole
+        subtree. A leaf has a height of 0 and an empty subtree has a height of -1.
 
         Args:
-            AVLNode_id (int): The unique ID of the node.
+            key (Any): The key that orders the node in the tree, any mutually comparable value.
             data (Any): The provided data stored in the node.
-            parent (AVLNode): The parent node of this node, or 'None' if the node is the root of the AVL tree.
         """
-        self.id = AVLNode_id
+        self.key = key
         self.data = data
-        self.parent = parent
         self.left: Optional['AVLNode'] = None
         self.right: Optional['AVLNode'] = None
-
-        #  Calculation level
-        #  self.level = parent + 1 if parent else 0
-        if parent:
-            self.level = parent.level + 1
-        else:
-            self.level = 0
+        self.height = 0
+        self.size = 1
 
     def is_leaf(self) -> bool:
         """Checks is the node is leaf.
@@ -75,27 +61,17 @@ class AVLNode:
         """
         return not (self.left or self.right)
 
-    @property
-    def height(self) -> int:
-        """Calculates the height of the node.
-
-        The height of a leaf node is 0. For non-leaf nodes, the height is the maximum of the heights
-        of the left and right children, plus 1.
+    def update(self) -> None:
+        """Recomputes the cached height and subtree size from those of the children in O(1).
 
-        Returns:
-            int: The height of the node.
+        Must be called whenever a child of the node changes, children before parents.
         """
-        if self.is_leaf():
-            return 0
-
-        left_height = self.left.height if self.left else 0
-        right_height = self.right.height if self.right else 0
-
-        return max(left_height, right_height) + 1
+        self.height = max(_height(self.left), _height(self.right)) + 1
+        self.size = _size(self.left) + _size(self.right) + 1
 
     def __repr__(self) -> str:
         """String representation of the AVL node."""
-        return f"AVLNode id={self.id}, data={self.data}, height={self.height}"
+        return f"AVLNode key={self.key}, data={self.data}, height={self.height}"
 
     @property
     def balancing_factor(self) -> int:
@@ -106,63 +82,288 @@ class AVLNode:
         Returns:
             int: The balancing factor itself.
         """
-        left_height = self.left.height if self.left else -1
-        right_height = self.right.height if self.right else -1
-        return left_height - right_height
+        return _height(self.left) - _height(self.right)
 
 
 class AVLTree:
-    """Represents an AVL tree in a binary search tree."""
-    def __init__(self, root_data: Any):
-        """Initializes the AVL tree with the given root of the tree.
+    """Represents a keyed, self-balancing AVL tree.
+
+    After every insertion and deletion the nodes on the changed path are rebalanced with
+    LL, LR, RR and RL rotations, so the heights of the two subtrees of every node differ
+    by at most one and the tree height stays below 1.45 log2(n + 2). Every operation
+    walks a single root-to-leaf path and is O(log n). The subtree sizes kept in the nodes
+    make the tree an order-statistic tree: 'rank', 'select' and 'count_range' are O(log n)
+    as well, and 'range' yields k keys in O(log n + k).
+    """
+    def __init__(self):
+        """Initializes an empty AVL tree."""
+        self.root: Optional[AVLNode] = None
 
-        This method creates the root of the AVL tree with the given data and assigns it a unique ID of '0'.
-        Sets 'self.map' dictionary. The dictionary maps each node's ID to the node itself (not just the data),
-        allowing quick access to any node in the tree.
+    @classmethod
+    def from_sorted(cls, keys: Iterable, data: Optional[Iterable] = None) -> 'AVLTree':
+        """Builds a perfectly balanced tree from strictly increasing keys in O(n).
+
+        The keys are consumed in order while the tree is built bottom-up, every subtree
+        taking half of the remaining keys, so no comparison beyond the order check and
+        no rotation is needed. Only the number of keys must be known in advance, an
+        iterable without a length is collected into a list first.
 
         Args:
-            root_data (Any): The provided data is stored in the root.
+            keys (Iterable): The keys in strictly increasing order.
+            data (Iterable | None): The data of every key in the same order, or 'None'.
+
+        Returns:
+            AVLTree: The built tree.
+
+        Raises:
+            ValueError: If the keys are not strictly increasing, or there is less data than keys.
         """
-        self.root = AVLNode(AVLNode_id=0, data=root_data)
-        self.map = {0: self.root}
+        if not hasattr(keys, '__len__'):
+            keys = list(keys)
+        key_iter = iter(keys)
+        data_iter = iter(data) if data is not None else None
+        previous = _MISSING
+
+        def build(count: int) -> Optional[AVLNode]:
+            nonlocal previous
+            if count == 0:
+                return None
+            left = build((count - 1) // 2)
+            key = next(key_iter)
+            if previous is not _MISSING and not previous < key:
+                raise ValueError(f"The keys are not strictly increasing: {previous!r} before {key!r}.")
+            previous = key
+            node = AVLNode(key, None if data_iter is None else next(data_iter, _MISSING))
+            if node.data is _MISSING:
+                raise ValueError("There is less data than keys.")
+            node.left = left
+            node.right = build(count - 1 - (count - 1) // 2)
+            node.update()
+            return node
+
+        tree = cls()
+        tree.root = build(len(keys))
+        return tree
+
+    def __len__(self) -> int:
+        """Returns the number of keys in the tree."""
+        return _size(self.root)
+
+    def __contains__(self, key: Any) -> bool:
+        """Checks if the key is in the tree."""
+        return self.search(key) is not None
+
+    def insert(self, key: Any, data: Any = None) -> None:
+        """Inserts a key with its data, or replaces the data if the key is already in the tree.
 
-    def add_child(self, child_data: Any, to_node: AVLNode | int) -> AVLNode:
-        """Adds a child node to a parent node in the AVL tree.
+        Args:
+            key (Any): The key to insert.
+            data (Any): The data stored with the key.
+        """
+        self.root = _insert(self.root, key, data)
 
-        This method creates a new node with the given data and attaches it to the specified parent node.
-        The parent node is determined by either its unique ID or by providing the parent node object directly.
-        The child node is added to the left child if it is available, otherwise to the right child.
-        If both left and right children are already occupied, a custom error is raised.
+    def delete(self, key: Any) -> None:
+        """Removes a key from the tree.
 
         Args:
-            child_data (Any): The provided data that is stored in the node.
-            to_node (AVLNode | int): The parent node to attach the new child node to.
+            key (Any): The key to remove.
+
+        Raises:
+            KeyError: If the key is not in the tree.
+        """
+        self.root = _delete(self.root, key)
+
+    def search(self, key: Any) -> Optional[AVLNode]:
+        """Finds the node of the key.
+
+        Args:
+            key (Any): The key to find.
+
+        Returns:
+            AVLNode: The node holding the key, or 'None' if the key is not in the tree.
+        """
+        node = self.root
+        while node and node.key != key:
+            node = node.left if key < node.key else node.right
+        return node
+
+    def min(self) -> Any:
+        """Returns the smallest key, or 'None' if the tree is empty."""
+        node = self.root
+        if node is None:
+            return None
+        while node.left:
+            node = node.left
+        return node.key
+
+    def max(self) -> Any:
+        """Returns the largest key, or 'None' if the tree is empty."""
+        node = self.root
+        if node is None:
+            return None
+        while node.right:
+            node = node.right
+        return node.key
+
+    def floor(self, key: Any) -> Any:
+        """Returns the largest key less than or equal to the given key, or 'None' if there is none."""
+        node, found = self.root, None
+        while node:
+            if node.key == key:
+                return node.key
+            if node.key < key:
+                found = node.key
+                node = node.right
+            else:
+                node = node.left
+        return found
+
+    def ceil(self, key: Any) -> Any:
+        """Returns the smallest key greater than or equal to the given key, or 'None' if there is none."""
+        node, found = self.root, None
+        while node:
+            if node.key == key:
+                return node.key
+            if node.key > key:
+                found = node.key
+                node = node.left
+            else:
+                node = node.right
+        return found
+
+    def rank(self, key: Any) -> int:
+        """Returns the number of keys less than the given key, which need not be in the tree."""
+        return _count_less(self.root, key, inclusive=False)
+
+    def select(self, index: int) -> Any:
+        """Returns the key at the given position in sorted order.
+
+        Args:
+            index (int): The 0-based position, negative values count from the largest key.
 
         Returns:
-            AVLNode: The newly created child node.
+            Any: The key with exactly index smaller keys.
 
         Raises:
-            MaxChildrenError: If the parent node already has two children (left and right).
+            IndexError: If the index is out of range.
         """
-        if isinstance(to_node, AVLNode):
-            node_id = to_node.id
-        else:
-            node_id = to_node
-
-        parent = self.map[node_id]
-        last_id = len(self.map)
-        new_node = AVLNode(AVLNode_id=last_id, data=child_data, parent=parent)
-        if not parent.left:
-            parent.left = new_node
-        elif not parent.right:
-            parent.right = new_node
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("AVLTree index out of range")
+
+        node = self.root
+        while True:
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index > left_size:
+                index -= left_size + 1
+                node = node.right
+            else:
+                return node.key
+
+    def count_range(self, lo: Any, hi: Any) -> int:
+        """Returns the number of keys with lo <= key <= hi in O(log n)."""
+        if hi < lo:
+            return 0
+        return _count_less(self.root, hi, inclusive=True) - _count_less(self.root, lo, inclusive=False)
+
+    def range(self, lo: Any = None, hi: Any = None):
+        """Lazily iterates over the keys with lo <= key <= hi in ascending order.
+
+        Only the path to lo and the yielded nodes are visited, so taking the first k keys
+        costs O(log n + k) and nothing is materialised. The tree must not be changed
+        while the iterator is in use.
+
+        Args:
+            lo (Any): The smallest key to yield, or 'None' for no lower bound.
+            hi (Any): The largest key to yield, or 'None' for no upper bound.
+
+        Yields:
+            Any: The next key in ascending order.
+        """
+        stack = Stack()
+
+        def push_left(node: Optional[AVLNode]) -> None:
+            while node:
+                if lo is not None and node.key < lo:
+                    node = node.right
+                else:
+                    stack.push(node)
+                    node = node.left
+
+        push_left(self.root)
+        while not stack.is_empty():
+            node = stack.pop()
+            if hi is not None and hi < node.key:
+                return
+            yield node.key
+            push_left(node.right)
+
+    def split(self, key: Any) -> tuple['AVLTree', 'AVLTree']:
+        """Splits the tree into the keys less than key and the keys greater than or equal to it.
+
+        The nodes are moved, not copied, and the split costs O(log n). This tree is left empty.
+
+        Args:
+            key (Any): The splitting key, which need not be in the tree.
+
+        Returns:
+            tuple[AVLTree, AVLTree]: The trees of the smaller keys and of the remaining keys.
+        """
+        left, equal, right = _split(self.root, key)
+        if equal:
+            right = _join(None, equal, right)
+        self.root = None
+        return self._wrap(left), self._wrap(right)
+
+    def join(self, other: 'AVLTree') -> None:
+        """Appends every key of other, which must all be greater than the keys of this tree.
+
+        The taller tree is descended until a subtree of matching height is found, so the join
+        costs O(|height difference| + log n). The other tree is left empty.
+
+        Args:
+            other (AVLTree): The tree with the greater keys.
+
+        Raises:
+            ValueError: If a key of other is not greater than every key of this tree.
+        """
+        if self.root and other.root and not self.max() < other.min():
+            raise ValueError("Every key of the joined tree must be greater than the keys of this tree.")
+        if self.root is None:
+            self.root = other.root
+        elif other.root:
+            right, middle = _pop_min(other.root)
+            self.root = _join(self.root, middle, right)
+        other.root = None
+
+    def union(self, other: 'AVLTree') -> None:
+        """Merges every key of other into this tree, the data of other wins for shared keys.
+
+        The larger tree is split by the keys of the smaller one and the parts are joined back,
+        which costs O(m log(n/m + 1)) for trees of m <= n keys instead of O(m log n) for
+        inserting one by one. The other tree is left empty.
+
+        Args:
+            other (AVLTree): The tree to merge into this one.
+        """
+        if len(self) < len(other):
+            self.root = _union(self.root, other.root, small_wins=False)
         else:
-            raise MaxChildrenError("In BinaryTree one can't be added more than 2 Nodes to parent.")
-        self.map[last_id] = new_node
-        return new_node
+            self.root = _union(other.root, self.root, small_wins=True)
+        other.root = None
+
+    @classmethod
+    def _wrap(cls, root: Optional[AVLNode]) -> 'AVLTree':
+        """Returns a new tree with the given root."""
+        tree = cls()
+        tree.root = root
+        return tree
 
     def __iter__(self):
-        """Performs a Preorder Depth-First Search (DFS) traversal of the binary tree.
+        """Performs a Preorder Depth-First Search (DFS) traversal of the AVL tree.
 
         This method uses a stack to recursive traverse.
         The root node is pushed onto the stack first. Then, nodes are popped one by one,
@@ -171,23 +372,36 @@ class AVLTree:
         This ensures that the left subtree is processed before the right subtree.
 
         Yields:
-            BinaryNode: The next node in the tree, following the Preorder DFS traversal order.
+            AVLNode: The next node in the tree, following the Preorder DFS traversal order.
         """
+        if self.root is None:
+            return
+
         stack = Stack()
         stack.push(self.root)
 
         while not stack.is_empty():
             current: AVLNode = stack.pop()
-            if current.left:
-                stack.push(current.left)
             if current.right:
                 stack.push(current.right)
+            if current.left:
+                stack.push(current.left)
             yield current
 
     def display(self) -> None:
         """Displays each node with indentation based on its level in the AVL tree."""
-        for node in self:
-            print("  " * node.level + str(node))
+        if self.root is None:
+            return
+
+        stack = Stack()
+        stack.push((self.root, 0))
+        while not stack.is_empty():
+            node, level = stack.pop()
+            print("  " * level + str(node))
+            if node.right:
+                stack.push((node.right, level + 1))
+            if node.left:
+                stack.push((node.left, level + 1))
 
     def root_imbalance(self) -> str:
         """Determines the imbalance type of the tree's root node.
@@ -201,42 +415,286 @@ class AVLTree:
         - 'LR' (Left-Right): Imbalance caused by the left subtree being higher, and its right child being too high.
         - 'RL' (Right-Left): Imbalance caused by the right subtree being higher, and its left child being too high.
 
-        If the tree is balanced, the method will return 'Balanced'.
+        If the tree is balanced, the method will return 'Balanced'. Since 'insert' and 'delete'
+        rebalance the tree, this is always the case between operations.
 
         Returns:
         str: A string describing the imbalance type ('LL', 'RR', 'LR', 'RL', or 'Balanced').
         """
-        balance = self.root.balancing_factor
+        return _imbalance(self.root) if self.root else "Balanced"
 
-        if balance > 1:
-            if self.root.left.balancing_factor >= 0:
-                return "LL"
-            else:
-                return "LR"
 
-        elif balance < -1:
-            if self.root.right.balancing_factor <= 0:
-                return "RR"
-            else:
-                return "RL"
+_MISSING = object()
 
-        return "Balanced"
 
+def _height(node: Optional[AVLNode]) -> int:
+    """Returns the cached height of a subtree, -1 for an empty one."""
+    return node.height if node else -1
 
-if __name__ == "__main__":
-    from re import match
 
-    tree = AVLTree(1)
-    line_num = int(input())
+def _size(node: Optional[AVLNode]) -> int:
+    """Returns the cached number of nodes of a subtree."""
+    return node.size if node else 0
 
-    for _ in range(line_num):
-        line = input()
-        res = match(
-            r'(?P<parent_id>\d+): (?P<left>\d+)? ?(?P<right>\d+)?\s*', line)
 
-        if res['left']:
-            tree.add_child(int(res['left']), int(res['parent_id']))
-        if res['right']:
-            tree.add_child(int(res['right']), int(res['parent_id']))
+def _count_less(node: Optional[AVLNode], key: Any, inclusive: bool) -> int:
+    """Counts the keys of the subtree below key (or equal to it if inclusive) along one path."""
+    count = 0
+    while node:
+        if node.key < key or (inclusive and node.key == key):
+            count += _size(node.left) + 1
+            node = node.right
+        else:
+            node = node.left
+    return count
+
+
+def _imbalance(node: AVLNode) -> str:
+    """Classifies the imbalance of a node as 'LL', 'LR', 'RR', 'RL' or 'Balanced'."""
+    balance = node.balancing_factor
+
+    if balance > 1:
+        return "LL" if node.left.balancing_factor >= 0 else "LR"
+    if balance < -1:
+        return "RR" if node.right.balancing_factor <= 0 else "RL"
+    return "Balanced"
+
+
+def _rotate_right(node: AVLNode) -> AVLNode:
+    """Lifts the left child above the node and returns the new subtree root."""
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    node.update()
+    pivot.update()
+    return pivot
+
+
+def _rotate_left(node: AVLNode) -> AVLNode:
+    """Lifts the right child above the node and returns the new subtree root."""
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    node.update()
+    pivot.update()
+    return pivot
+
+
+def _rebalance(node: AVLNode) -> AVLNode:
+    """Updates the node after a change below it and repairs its balance with at most two rotations.
+
+    Returns:
+        AVLNode: The root of the repaired subtree.
+    """
+    node.update()
+    imbalance = _imbalance(node)
+    if imbalance == "LR":
+        node.left = _rotate_left(node.left)
+    elif imbalance == "RL":
+        node.right = _rotate_right(node.right)
+
+    if imbalance in ("LL", "LR"):
+        return _rotate_right(node)
+    if imbalance in ("RR", "RL"):
+        return _rotate_left(node)
+    return node
+
+
+def _insert(node: Optional[AVLNode], key: Any, data: Any) -> AVLNode:
+    """Inserts the key into the subtree and returns its new root."""
+    if node is None:
+        return AVLNode(key, data)
+
+    if key < node.key:
+        node.left = _insert(node.left, key, data)
+    elif node.key < key:
+        node.right = _insert(node.right, key, data)
+    else:
+        node.data = data
+        return node
+    return _rebalance(node)
+
+
+def _delete(node: Optional[AVLNode], key: Any) -> Optional[AVLNode]:
+    """Removes the key from the subtree and returns its new root.
+
+    Raises:
+        KeyError: If the key is not in the subtree.
+    """
+    if node is None:
+        raise KeyError(key)
+
+    if key < node.key:
+        node.left = _delete(node.left, key)
+    elif node.key < key:
+        node.right = _delete(node.right, key)
+    else:
+        if node.left is None:
+            return node.right
+        if node.right is None:
+            return node.left
+        #  The in-order successor takes the place of the removed node
+        right, successor = _pop_min(node.right)
+        successor.left, successor.right = node.left, right
+        node = successor
+    return _rebalance(node)
+
+
+def _pop_min(node: AVLNode) -> tuple[Optional[AVLNode], AVLNode]:
+    """Detaches the node with the smallest key and returns the new subtree root and that node."""
+    if node.left is None:
+        return node.right, node
+    node.left, smallest = _pop_min(node.left)
+    return _rebalance(node), smallest
+
+
+def _join(left: Optional[AVLNode], middle: AVLNode, right: Optional[AVLNode]) -> AVLNode:
+    """Joins two subtrees with a middle node whose key lies between them and returns the new root."""
+    if _height(left) > _height(right) + 1:
+        left.right = _join(left.right, middle, right)
+        return _rebalance(left)
+    if _height(right) > _height(left) + 1:
+        right.left = _join(left, middle, right.left)
+        return _rebalance(right)
+    middle.left, middle.right = left, right
+    middle.update()
+    return middle
+
+
+def _split(node: Optional[AVLNode], key: Any) -> tuple[Optional[AVLNode], Optional[AVLNode], Optional[AVLNode]]:
+    """Splits the subtree into the keys less than key, the node of key if present, and the greater keys."""
+    if node is None:
+        return None, None, None
+
+    left, right = node.left, node.right
+    if key < node.key:
+        smaller, equal, greater = _split(left, key)
+        return smaller, equal, _join(greater, node, right)
+    if node.key < key:
+        smaller, equal, greater = _split(right, key)
+        return _join(left, node, smaller), equal, greater
+    return left, node, right
+
+
+def _union(small: Optional[AVLNode], large: Optional[AVLNode], small_wins: bool) -> Optional[AVLNode]:
+    """Merges two subtrees by splitting the large one at the root of the small one, recursively."""
+    if small is None:
+        return large
+    if large is None:
+        return small
+
+    smaller, equal, greater = _split(large, small.key)
+    middle = small if equal is None or small_wins else equal
+    left = _union(small.left, smaller, small_wins)
+    right = _union(small.right, greater, small_wins)
+    return _join(left, middle, right)
+
+
+def _assert_valid(node: Optional[AVLNode], lo: Any = None, hi: Any = None) -> int:
+    """Checks the order, balance and cached height and size of a subtree and returns its size, for the tests."""
+    if node is None:
+        return 0
+    assert (lo is None or lo < node.key) and (hi is None or node.key < hi)
+    left_size, right_size = _assert_valid(node.left, lo, node.key), _assert_valid(node.right, node.key, hi)
+    assert node.height == 1 + max(_height(node.left), _height(node.right))
+    assert abs(_height(node.left) - _height(node.right)) <= 1
+    assert node.size == left_size + right_size + 1
+    return node.size
+
+
+def test_insert_and_delete_keep_the_tree_balanced():
+    from random import Random
+
+    import pytest
+
+    rng = Random(7)
+    tree, keys = AVLTree(), set()
+    for _ in range(2000):
+        key = rng.randrange(500)
+        if key in keys and rng.random() < 0.5:
+            tree.delete(key)
+            keys.discard(key)
+        else:
+            tree.insert(key, data=str(key))
+            keys.add(key)
+    assert _assert_valid(tree.root) == len(tree) == len(keys)
+    assert all((key in tree) == (key in keys) for key in range(500))
+    assert tree.search(min(keys)).data == str(min(keys)) and tree.search(-1) is None
+    with pytest.raises(KeyError):
+        tree.delete(-1)
+
+
+def test_order_statistics_and_ranges():
+    from bisect import bisect_left, bisect_right
+    from itertools import islice
+    from random import Random
+
+    import pytest
+
+    rng = Random(8)
+    keys = sorted(rng.sample(range(0, 1000, 2), 200))
+    tree = AVLTree()
+    for key in rng.sample(keys, len(keys)):
+        tree.insert(key)
+
+    assert (tree.min(), tree.max()) == (keys[0], keys[-1])
+    assert [tree.select(i) for i in range(len(keys))] == keys and tree.select(-1) == keys[-1]
+    for probe in range(-1, 1001, 7):
+        i = bisect_left(keys, probe)
+        assert tree.rank(probe) == i
+        assert tree.floor(probe) == (keys[bisect_right(keys, probe) - 1] if bisect_right(keys, probe) else None)
+        assert tree.ceil(probe) == (keys[i] if i < len(keys) else None)
+        assert tree.count_range(probe, probe + 100) == bisect_right(keys, probe + 100) - i
+        assert list(islice(tree.range(probe, probe + 100), 5)) == keys[i:bisect_right(keys, probe + 100)][:5]
+    assert list(tree.range()) == keys and tree.count_range(10, 5) == 0
+    with pytest.raises(IndexError):
+        tree.select(len(keys))
+
+
+def test_bulk_load_split_join_and_union():
+    import pytest
+
+    tree = AVLTree.from_sorted(range(0, 300, 3), data=(f"a{k}" for k in range(0, 300, 3)))
+    assert _assert_valid(tree.root) == 100 and tree.search(99).data == "a99"
+    with pytest.raises(ValueError):
+        AVLTree.from_sorted([1, 3, 3])
+
+    smaller, larger = tree.split(150)
+    assert tree.root is None and list(smaller.range()) == list(range(0, 150, 3))
+    assert list(larger.range()) == list(range(150, 300, 3))
+    _assert_valid(smaller.root)
+    _assert_valid(larger.root)
+
+    right = AVLTree.from_sorted(range(1000, 1003))
+    larger.join(right)
+    assert right.root is None and _assert_valid(larger.root) == 53 and larger.max() == 1002
+    with pytest.raises(ValueError):
+        smaller.join(AVLTree.from_sorted([5]))
+
+    other = AVLTree.from_sorted(range(0, 150, 5), data=("b" for _ in range(30)))
+    smaller.union(other)
+    expected = sorted(set(range(0, 150, 3)) | set(range(0, 150, 5)))
+    assert other.root is None and list(smaller.range()) == expected
+    assert _assert_valid(smaller.root) == len(expected)
+    assert smaller.search(15).data == "b" and smaller.search(3).data == "a3"
 
+
+if __name__ == "__main__":
+    """> 5 3 8 1 4 7 9 2 6   # Keys to insert
+       > 4                   # Key to delete
+    """
+    tree = AVLTree()
+    for key in map(int, input("Enter keys: ").split()):
+        tree.insert(key)
+    tree.delete(int(input("Enter a key to delete: ")))
+
+    tree.display()
+    print(f"min={tree.min()}, max={tree.max()}, floor(4)={tree.floor(4)}, ceil(4)={tree.ceil(4)}")
+    print(f"rank(6)={tree.rank(6)}, select(0)={tree.select(0)}, count_range(2, 7)={tree.count_range(2, 7)}")
+    print("Keys in [2, 7]:", list(tree.range(2, 7)))
+
+    snapshot = AVLTree.from_sorted(range(0, 20, 2))
+    tree.union(snapshot)
+    smaller, larger = tree.split(10)
+    print("Merged keys below 10:", list(smaller.range()), "from 10:", list(larger.range()))
     print(tree.root_imbalance())
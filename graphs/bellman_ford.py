@@ -0,0 +1,164 @@
+from collections import deque
+
+from .adjacency import as_adjacency
+
+
+class NegativeCycleError(Exception):
+    """Raised when a graph contains a negative cycle, so shortest paths are not defined.
+
+    Attributes:
+        cycle (list): The vertices of one negative cycle in edge order, the first vertex repeated
+            at the end, or an empty list if the cycle could not be recovered.
+    """
+    def __init__(self, cycle: list) -> None:
+        super().__init__(f"The graph contains a negative cycle: {' -> '.join(map(str, cycle))}.")
+        self.cycle = cycle
+
+
+def bellman_ford(graph, source=None):
+    """Computes shortest distances with the Bellman-Ford algorithm, negative weights are allowed.
+
+    Every round relaxes all edges once. The loop stops as soon as a round makes no
+    relaxation, so graphs with short shortest paths finish long before V rounds.
+    If source is 'None', the distances are measured from a virtual vertex connected to every
+    vertex with a 0 edge, which gives the potentials used by Johnson's algorithm and finds
+    negative cycles anywhere in the graph.
+
+    Args:
+        graph (WeightedGraph | CSRGraph | dict): The weighted graph, directed or undirected.
+        source (int | None): The starting vertex, or 'None' for the virtual source.
+
+    Returns:
+        tuple: A tuple (dist, prev) of mappings like 'shortest_path_tree' returns.
+
+    Raises:
+        NegativeCycleError: If a negative cycle is reachable from the source.
+    """
+    adj_list = as_adjacency(graph)
+    dist, prev = _init(adj_list, source)
+
+    last_relaxed = None
+    for _ in range(len(adj_list) + 1):
+        last_relaxed = None
+        for u in adj_list:
+            curr_dist = dist[u]
+            if curr_dist == float('inf'):
+                continue
+            for v, weight in adj_list[u]:
+                if curr_dist + weight < dist[v]:
+                    dist[v] = curr_dist + weight
+                    prev[v] = u
+                    last_relaxed = v
+        if last_relaxed is None:
+            return dist, prev
+
+    raise NegativeCycleError(_find_cycle(prev, last_relaxed, len(adj_list)))
+
+
+def spfa(graph, source=None):
+    """Computes shortest distances with the queue-based Bellman-Ford variant (SPFA).
+
+    Instead of relaxing every edge in every round, only the edges of vertices whose distance
+    changed are relaxed, which is usually far fewer. A vertex whose shortest path would have
+    V or more edges proves a negative cycle.
+
+    Args:
+        graph (WeightedGraph | CSRGraph | dict): The weighted graph, directed or undirected.
+        source (int | None): The starting vertex, or 'None' for the virtual source, see 'bellman_ford'.
+
+    Returns:
+        tuple: A tuple (dist, prev) of mappings like 'bellman_ford' returns.
+
+    Raises:
+        NegativeCycleError: If a negative cycle is reachable from the source.
+    """
+    adj_list = as_adjacency(graph)
+    dist, prev = _init(adj_list, source)
+    num_vertices = len(adj_list)
+
+    queue = deque(adj_list if source is None else [source])
+    in_queue = set(queue)
+    edges_on_path = dict.fromkeys(adj_list, 0)
+
+    while queue:
+        u = queue.popleft()
+        in_queue.discard(u)
+        curr_dist = dist[u]
+        for v, weight in adj_list[u]:
+            if curr_dist + weight < dist[v]:
+                dist[v] = curr_dist + weight
+                prev[v] = u
+                edges_on_path[v] = edges_on_path[u] + 1
+                if edges_on_path[v] >= num_vertices:
+                    raise NegativeCycleError(_find_cycle(prev, v, num_vertices))
+                if v not in in_queue:
+                    queue.append(v)
+                    in_queue.add(v)
+
+    return dist, prev
+
+
+def _init(adj_list, source) -> tuple[dict, dict]:
+    """Returns the initial dist and prev mappings for a real or the virtual source."""
+    if source is None:
+        dist = dict.fromkeys(adj_list, 0)
+    else:
+        dist = dict.fromkeys(adj_list, float('inf'))
+        dist[source] = 0
+    return dist, dict.fromkeys(adj_list)
+
+
+def _find_cycle(prev: dict, vertex, num_vertices: int) -> list:
+    """Recovers the negative cycle that the predecessor chain of vertex runs into.
+
+    After V steps back along the predecessors the walk is guaranteed to be on the cycle,
+    then the cycle is followed until it closes.
+    """
+    for _ in range(num_vertices):
+        if prev[vertex] is None:
+            return []
+        vertex = prev[vertex]
+
+    cycle = [vertex]
+    current = prev[vertex]
+    while current != vertex:
+        cycle.append(current)
+        current = prev[current]
+    cycle.append(vertex)
+    cycle.reverse()
+    return cycle
+
+
+def test_bellman_ford_and_spfa_agree_and_find_cycles():
+    import pytest
+
+    graph = {1: [(2, 4), (3, 5)], 2: [(4, -3)], 3: [(4, 2)], 4: [(5, 1)], 5: []}
+    for solve in (bellman_ford, spfa):
+        dist, prev = solve(graph, 1)
+        assert dist == {1: 0, 2: 4, 3: 5, 4: 1, 5: 2} and prev[5] == 4
+        assert solve(graph)[0] == {1: 0, 2: 0, 3: 0, 4: -3, 5: -2}
+
+    graph[5].append((2, 1))
+    for solve in (bellman_ford, spfa):
+        with pytest.raises(NegativeCycleError) as error:
+            solve(graph, 1)
+        cycle = error.value.cycle
+        assert cycle[0] == cycle[-1] and set(cycle) == {2, 4, 5}
+
+
+if __name__ == "__main__":
+    cost_graph = {
+        1: [(2, 4), (3, 5)],
+        2: [(4, -3)],   # A rebate on the edge 2 -> 4
+        3: [(4, 2)],
+        4: [(5, 1)],
+        5: [],
+    }
+    print(bellman_ford(cost_graph, 1))
+    print(spfa(cost_graph, 1))
+
+    cost_graph[5].append((2, 1))    # 2 -> 4 -> 5 -> 2 costs -1
+    try:
+        spfa(cost_graph, 1)
+    except NegativeCycleError as e:
+        print(e.cycle)
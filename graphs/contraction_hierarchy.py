@@ -0,0 +1,297 @@
+import heapq
+import json
+
+from .adjacency import as_adjacency
+
+#  Marks an edge of the original graph, as opposed to a shortcut over a contracted vertex
+NO_MIDDLE = -1
+
+
+class ContractionHierarchy:
+    """Represents a contraction hierarchy of an undirected weighted graph.
+
+    The vertices are contracted one by one in order of importance. Contracting a vertex removes
+    it from the remaining graph and adds a shortcut between two of its neighbours whenever the path
+    through the vertex is the only shortest path between them. Every vertex keeps its 'upward' edges,
+    the edges to the neighbours that were still present when it was contracted. Any shortest path can then be
+    found by two small Dijkstra searches that only follow upward edges, one from each end.
+
+    Internally the vertices are numbered 0..n-1 in the order of 'vertices'. 'up[i]' maps every
+    upward neighbour of i to (weight, middle), where middle is the contracted vertex a shortcut
+    goes over, or NO_MIDDLE for an original edge.
+    """
+    def __init__(self, vertices: list, up: list[dict[int, tuple]]) -> None:
+        """Initializes the hierarchy from already computed upward edges.
+
+        Args:
+            vertices (list): The vertex ids of the graph.
+            up (list[dict[int, tuple]]): The upward edges of every vertex.
+        """
+        self.vertices = vertices
+        self.index = {vertex: i for i, vertex in enumerate(vertices)}
+        self.up = up
+
+    @classmethod
+    def build(cls, graph, witness_limit: int = 500) -> 'ContractionHierarchy':
+        """Preprocesses the graph into a contraction hierarchy.
+
+        The next vertex to contract is the one with the smallest edge difference
+        (shortcuts added - edges removed + already contracted neighbours). The priorities
+        are updated lazily: a popped vertex is re-evaluated and pushed back if it got worse.
+
+        Args:
+            graph (WeightedGraph | CSRGraph | dict): The undirected weighted graph.
+            witness_limit (int): How many vertices a witness search may settle before it gives up.
+                A stopped search adds a shortcut that might be unnecessary, which costs
+                memory but never changes the query results.
+
+        Returns:
+            ContractionHierarchy: The built hierarchy.
+        """
+        adj_list = as_adjacency(graph)
+        vertices = list(adj_list)
+        index = {vertex: i for i, vertex in enumerate(vertices)}
+
+        remaining = [dict() for _ in vertices]
+        for u in adj_list:
+            i = index[u]
+            for v, weight in adj_list[u]:
+                j = index[v]
+                if i != j and weight < remaining[i].get(j, (float('inf'),))[0]:
+                    remaining[i][j] = remaining[j][i] = (weight, NO_MIDDLE)
+
+        up = [None] * len(vertices)
+        contracted_neighbours = [0] * len(vertices)
+
+        def priority(v):
+            shortcuts = _shortcuts(remaining, v, witness_limit)
+            return len(shortcuts) - len(remaining[v]) + contracted_neighbours[v]
+
+        pq = [(priority(v), v) for v in range(len(vertices))]
+        heapq.heapify(pq)
+
+        while pq:
+            _, v = heapq.heappop(pq)
+            new_priority = priority(v)
+            if pq and new_priority > pq[0][0]:
+                heapq.heappush(pq, (new_priority, v))
+                continue
+
+            for u, x, weight in _shortcuts(remaining, v, witness_limit):
+                if weight < remaining[u].get(x, (float('inf'),))[0]:
+                    remaining[u][x] = remaining[x][u] = (weight, v)
+
+            up[v] = remaining[v]
+            remaining[v] = {}
+            for u in up[v]:
+                del remaining[u][v]
+                contracted_neighbours[u] += 1
+
+        return cls(vertices, up)
+
+    def save(self, path: str) -> None:
+        """Writes the hierarchy to a JSON file.
+
+        Args:
+            path (str): The output file.
+        """
+        with open(path, 'w') as file:
+            json.dump({
+                "vertices": self.vertices,
+                "up": [[[u, weight, middle] for u, (weight, middle) in edges.items()] for edges in self.up],
+            }, file)
+
+    @classmethod
+    def load(cls, path: str) -> 'ContractionHierarchy':
+        """Reads a hierarchy written by 'save'.
+
+        Args:
+            path (str): The file to read.
+
+        Returns:
+            ContractionHierarchy: The loaded hierarchy.
+        """
+        with open(path) as file:
+            data = json.load(file)
+        up = [{u: (weight, middle) for u, weight, middle in edges} for edges in data["up"]]
+        return cls(data["vertices"], up)
+
+    def query(self, start, end) -> tuple[float, list]:
+        """Finds the shortest path between two vertices.
+
+        Both searches only follow upward edges and each of them stops once its queue head
+        is not shorter than the best connection found so far. The shortcuts on the resulting
+        path are unpacked back into original edges.
+
+        Args:
+            start (int): The starting vertex.
+            end (int): The target vertex.
+
+        Returns:
+            tuple[float, list]: The shortest distance and the path from start to end,
+            or ('inf', []) if end is unreachable, like 'bidirectional_dijkstra'.
+        """
+        best, meeting, prev = self._search(self.index[start], self.index[end])
+        if meeting is None:
+            return float('inf'), []
+
+        chain = []
+        v = meeting
+        while v is not None:
+            chain.append(v)
+            v = prev[0][v]
+        chain.reverse()
+        v = prev[1][meeting]
+        while v is not None:
+            chain.append(v)
+            v = prev[1][v]
+
+        path = [chain[0]]
+        for a, b in zip(chain, chain[1:]):
+            self._unpack(a, b, path)
+        return best, [self.vertices[i] for i in path]
+
+    def distance(self, start, end) -> float:
+        """Returns the shortest distance between two vertices, 'inf' if end is unreachable.
+
+        Unlike 'query', the path is not unpacked, so only the two upward searches are run.
+        """
+        return self._search(self.index[start], self.index[end])[0]
+
+    def _search(self, s: int, t: int) -> tuple:
+        """Runs the two upward searches and returns (best, meeting, prev) for the internal indices s and t."""
+        dist = ({s: 0}, {t: 0})
+        prev = ({s: None}, {t: None})
+        queues = ([(0, s)], [(0, t)])
+        best = 0 if s == t else float('inf')
+        meeting = s if s == t else None
+
+        while queues[0] or queues[1]:
+            side = 0 if queues[0] and (not queues[1] or queues[0][0][0] <= queues[1][0][0]) else 1
+            curr_dist, u = heapq.heappop(queues[side])
+            if curr_dist >= best:
+                queues[side].clear()
+                continue
+            if curr_dist > dist[side][u]:
+                continue
+
+            other = dist[1 - side]
+            if u in other and curr_dist + other[u] < best:
+                best = curr_dist + other[u]
+                meeting = u
+
+            for v, (weight, _) in self.up[u].items():
+                new_dist = curr_dist + weight
+                if new_dist < dist[side].get(v, float('inf')):
+                    dist[side][v] = new_dist
+                    prev[side][v] = u
+                    heapq.heappush(queues[side], (new_dist, v))
+
+        return best, meeting, prev
+
+    def _unpack(self, a: int, b: int, path: list[int]) -> None:
+        """Appends the original vertices of the edge a-b, without a itself, to the path."""
+        stack = [(a, b)]
+        while stack:
+            a, b = stack.pop()
+            edge = self.up[a].get(b) or self.up[b].get(a)
+            middle = edge[1]
+            if middle == NO_MIDDLE:
+                path.append(b)
+            else:
+                stack.append((middle, b))
+                stack.append((a, middle))
+
+
+def _shortcuts(remaining: list[dict], v: int, witness_limit: int) -> list[tuple[int, int, int]]:
+    """Returns the shortcuts (u, x, weight) needed to contract v from the remaining graph.
+
+    A shortcut u-x over v is not needed if a witness search from u that avoids v finds another
+    path to x that is not longer than the path through v.
+    """
+    neighbours = list(remaining[v].items())
+    shortcuts = []
+    for i, (u, (weight_u, _)) in enumerate(neighbours[:-1]):
+        targets = neighbours[i + 1:]
+        max_dist = weight_u + max(weight for _, (weight, _) in targets)
+        witness = _witness_search(remaining, u, v, max_dist, witness_limit)
+        for x, (weight_x, _) in targets:
+            via_v = weight_u + weight_x
+            if witness.get(x, float('inf')) > via_v:
+                shortcuts.append((u, x, via_v))
+    return shortcuts
+
+
+def _witness_search(remaining: list[dict], source: int, excluded: int, max_dist: float, limit: int) -> dict:
+    """Runs a bounded Dijkstra search from source that never enters the excluded vertex."""
+    dist = {source: 0}
+    pq = [(0, source)]
+    settled = 0
+    while pq:
+        curr_dist, u = heapq.heappop(pq)
+        if curr_dist > dist[u]:
+            continue
+        settled += 1
+        if curr_dist > max_dist or settled > limit:
+            break
+        for v, (weight, _) in remaining[u].items():
+            if v == excluded:
+                continue
+            new_dist = curr_dist + weight
+            if new_dist < dist.get(v, float('inf')):
+                dist[v] = new_dist
+                heapq.heappush(pq, (new_dist, v))
+    return dist
+
+
+def test_hierarchy_matches_dijkstra(tmp_path):
+    from random import Random
+
+    from .dijkstra_algorithm import shortest_path_tree
+
+    rng = Random(2)
+    graph = {v: [] for v in range(1, 101)}
+    for _ in range(250):
+        u, v, w = rng.randint(1, 100), rng.randint(1, 100), rng.randint(1, 9)
+        graph[u].append((v, w))
+        graph[v].append((u, w))
+
+    hierarchy = ContractionHierarchy.build(graph)
+    hierarchy.save(str(tmp_path / "hierarchy.json"))
+    loaded = ContractionHierarchy.load(str(tmp_path / "hierarchy.json"))
+    for start in (1, 50, 99):
+        dist, _ = shortest_path_tree(graph, start)
+        for end in graph:
+            found, path = loaded.query(start, end)
+            assert found == dist[end] == hierarchy.distance(start, end)
+            if path:
+                assert (path[0], path[-1]) == (start, end)
+                assert sum(min(w for x, w in graph[u] if x == v) for u, v in zip(path, path[1:])) == found
+
+
+if __name__ == "__main__":
+    from random import Random
+    from time import perf_counter
+
+    from .dijkstra_algorithm import shortest_path_tree
+
+    #  A road-like 60 x 60 grid with random travel times
+    rng = Random(0)
+    side = 60
+    graph = {v: [] for v in range(1, side * side + 1)}
+    for v in graph:
+        for u in (v + 1 if v % side else None, v + side if v + side <= side * side else None):
+            if u is not None:
+                weight = rng.randint(1, 10)
+                graph[v].append((u, weight))
+                graph[u].append((v, weight))
+
+    begin = perf_counter()
+    hierarchy = ContractionHierarchy.build(graph)
+    print(f"Preprocessing: {perf_counter() - begin:.2f} s")
+
+    dist, _ = shortest_path_tree(graph, 1)
+    begin = perf_counter()
+    for target in graph:
+        assert hierarchy.distance(1, target) == dist[target]
+    print(f"{len(graph)} queries: {perf_counter() - begin:.3f} s, all equal to Dijkstra")
@@ -0,0 +1,276 @@
+from array import array
+from collections.abc import Iterable, Mapping
+
+from .adjacency import as_adjacency
+
+
+class CSRGraph(Mapping):
+    """Represents a frozen weighted graph in compressed sparse row (CSR) form.
+
+    The vertices are numbered from 1 to num_vertices like in 'WeightedGraph'. All edges are
+    kept in three flat arrays instead of one Python tuple per edge:
+    - offsets: the edges of vertex v are stored at positions offsets[v]..offsets[v+1]-1,
+    - targets: the neighbour at the other end of every edge,
+    - weights: the weight of every edge.
+    The arrays support the buffer protocol, so they can be wrapped by 'numpy.frombuffer' without a copy.
+
+    The graph behaves as a read-only mapping from a vertex to its (neighbour, weight) pairs,
+    so it can be passed anywhere an adjacency list is accepted.
+    """
+    def __init__(self, offsets: array, targets: array, weights: array) -> None:
+        """Initializes the graph from already built CSR arrays.
+
+        Args:
+            offsets (array): Edge offsets of length num_vertices + 2, offsets[0] and offsets[1] are 0.
+            targets (array): Neighbour of every edge.
+            weights (array): Weight of every edge.
+
+        Raises:
+            ValueError: If the lengths of the arrays do not match.
+        """
+        if len(targets) != len(weights) or offsets[-1] != len(targets):
+            raise ValueError("The offsets, targets and weights arrays do not describe the same edges.")
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.num_vertices = len(offsets) - 2
+
+    @classmethod
+    def from_edges(cls, num_vertices: int | None, edges: Iterable[tuple[int, int, int | float]],
+                   directed: bool = False) -> 'CSRGraph':
+        """Builds a CSR graph from an edge list in a single pass over the edges.
+
+        The edges are buffered in flat arrays and then placed into their rows with
+        a counting sort, so no per-edge Python object is kept. Vertex ids are stored as
+        32-bit integers, integer weights in 32 bits unless one needs 64. A NumPy array
+        of shape (E, 3) is accepted as well and is sorted into rows by NumPy, see '_from_array'.
+
+        Args:
+            num_vertices (int | None): The number of vertices, numbered from 1, or 'None'
+                to take the largest vertex in the edges.
+            edges (Iterable[tuple[int, int, int | float]]): The (vertex1, vertex2, weight) edges.
+            directed (bool): If False, every edge is stored in both directions.
+
+        Returns:
+            CSRGraph: The built graph.
+
+        Raises:
+            KeyError: If an edge refers to a vertex that is not in the graph.
+        """
+        if hasattr(edges, 'tolist'):
+            return cls._from_array(num_vertices, edges, directed)
+
+        #  32-bit vertex ids, and weights widened only when needed: 'i', then 'q', then 'd'
+        sources = array('i')
+        destinations = array('i')
+        edge_weights = array('i')
+        for v1, v2, w in edges:
+            sources.append(v1)
+            destinations.append(v2)
+            try:
+                edge_weights.append(w)
+            except OverflowError:
+                edge_weights = array('q', edge_weights)
+                edge_weights.append(w)
+            except TypeError:
+                edge_weights = array('d', edge_weights)
+                edge_weights.append(w)
+
+        if sources:
+            low = min(min(sources), min(destinations))
+            high = max(max(sources), max(destinations))
+            if num_vertices is None:
+                num_vertices = high
+            if low < 1 or high > num_vertices:
+                raise KeyError(f"An edge refers to a vertex outside 1..{num_vertices}.")
+        elif num_vertices is None:
+            num_vertices = 0
+
+        offsets = array('q', [0]) * (num_vertices + 2)
+        for v in sources:
+            offsets[v + 1] += 1
+        if not directed:
+            for v in destinations:
+                offsets[v + 1] += 1
+        for v in range(1, num_vertices + 2):
+            offsets[v] += offsets[v - 1]
+
+        #  The reverse direction of an undirected edge is placed in the same pass, without
+        #  building concatenated copies of the staging arrays
+        num_edges = offsets[-1]
+        targets = array('i', [0]) * num_edges
+        weights = array(edge_weights.typecode, [0]) * num_edges
+        fill = array('q', offsets)
+        for i in range(len(sources)):
+            v1, v2, w = sources[i], destinations[i], edge_weights[i]
+            slot = fill[v1]
+            targets[slot] = v2
+            weights[slot] = w
+            fill[v1] = slot + 1
+            if not directed:
+                slot = fill[v2]
+                targets[slot] = v1
+                weights[slot] = w
+                fill[v2] = slot + 1
+
+        return cls(offsets, targets, weights)
+
+    @classmethod
+    def _from_array(cls, num_vertices: int | None, edges, directed: bool) -> 'CSRGraph':
+        """Builds a CSR graph from a NumPy array of shape (E, 3) without a per-edge Python loop.
+
+        The row lengths come from 'np.bincount' over the sources and a stable 'np.argsort'
+        of the sources places the targets and weights into their rows. The vertex columns
+        may have a float dtype, a float weight column gives float weights.
+        """
+        import numpy as np  # The edges are a NumPy array, so NumPy is installed
+
+        sources, destinations, edge_weights = edges[:, 0], edges[:, 1], edges[:, 2]
+        if len(edges):
+            low = min(sources.min(), destinations.min())
+            high = int(max(sources.max(), destinations.max()))
+            if num_vertices is None:
+                num_vertices = high
+            if low < 1 or high > num_vertices:
+                raise KeyError(f"An edge refers to a vertex outside 1..{num_vertices}.")
+        elif num_vertices is None:
+            num_vertices = 0
+
+        if edge_weights.dtype.kind == 'f':
+            typecode = 'd'
+        elif len(edges) and not -2 ** 31 <= int(edge_weights.min()) <= int(edge_weights.max()) < 2 ** 31:
+            typecode = 'q'
+        else:
+            typecode = 'i'
+
+        sources = sources.astype(np.int32)
+        destinations = destinations.astype(np.int32)
+        edge_weights = edge_weights.astype(typecode)
+        if not directed:
+            sources, destinations = np.concatenate((sources, destinations)), np.concatenate((destinations, sources))
+            edge_weights = np.concatenate((edge_weights, edge_weights))
+
+        offsets = np.zeros(num_vertices + 2, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_vertices + 1)[1:], out=offsets[2:])
+        order = np.argsort(sources, kind='stable')
+        del sources
+
+        def to_array(values, code: str) -> array:
+            result = array(code)
+            result.frombytes(values.astype(code, copy=False).tobytes())
+            return result
+
+        return cls(to_array(offsets, 'q'), to_array(destinations[order], 'i'), to_array(edge_weights[order], typecode))
+
+    @classmethod
+    def from_weighted_graph(cls, graph) -> 'CSRGraph':
+        """Builds a CSR graph from an existing 'WeightedGraph' or adjacency list.
+
+        The adjacency lists are copied as they are, so an undirected graph keeps
+        both directions of every edge.
+
+        Args:
+            graph (WeightedGraph | dict): The graph with vertices 1..n, in any shape accepted by 'as_adjacency'.
+
+        Returns:
+            CSRGraph: The built graph.
+        """
+        adj_list = as_adjacency(graph)
+        num_vertices = len(adj_list)
+        edges = ((u, v, w) for u in range(1, num_vertices + 1) for v, w in adj_list[u])
+        return cls.from_edges(num_vertices, edges, directed=True)
+
+    def __reduce__(self):
+        """Pickles the graph with plain arrays, so a memory-mapped graph can be sent to worker processes."""
+        sections = (self.offsets, self.targets, self.weights)
+        return type(self), tuple(a if isinstance(a, array) else array(a.format, a) for a in sections)
+
+    def __getitem__(self, vertex: int) -> list[tuple[int, int | float]]:
+        """Returns the (neighbour, weight) pairs of the given vertex.
+
+        Raises:
+            KeyError: If the vertex is not in the graph.
+        """
+        if vertex not in self:
+            raise KeyError(vertex)
+        start, end = self.offsets[vertex], self.offsets[vertex + 1]
+        return list(zip(self.targets[start:end], self.weights[start:end]))
+
+    def __contains__(self, vertex: object) -> bool:
+        """Checks if the given vertex is in the graph."""
+        return isinstance(vertex, int) and 1 <= vertex <= self.num_vertices
+
+    def __iter__(self):
+        """Iterates over the vertices of the graph."""
+        return iter(range(1, self.num_vertices + 1))
+
+    def __len__(self) -> int:
+        """Returns the number of vertices in the graph."""
+        return self.num_vertices
+
+    @property
+    def num_edges(self) -> int:
+        """Returns the number of stored (directed) edges."""
+        return len(self.targets)
+
+    def degree(self, vertex: int) -> int:
+        """Returns the number of edges leaving the given vertex."""
+        return self.offsets[vertex + 1] - self.offsets[vertex]
+
+    def is_adjacent(self, vertex1: int, vertex2: int) -> bool:
+        """Checks that vertex2 is adjacent to vertex1.
+
+        Args:
+            vertex1 (int): The first given vertex.
+            vertex2 (int): The second given vertex.
+
+        Returns:
+            bool: True if vertex2 is adjacent to vertex1, False otherwise.
+        """
+        start, end = self.offsets[vertex1], self.offsets[vertex1 + 1]
+        return vertex2 in self.targets[start:end]
+
+    def return_adjacent(self, vertex: int) -> list[tuple[int, int | float]]:
+        """Returns all adjacent vertices with their weight to the given vertex."""
+        return self[vertex]
+
+
+def test_from_edges_matches_adjacency_lists():
+    from random import Random
+
+    rng = Random(0)
+    edges = [(rng.randint(1, 50), rng.randint(1, 50), rng.choice((rng.randint(1, 9), 2 ** 40, 0.5)))
+             for _ in range(300)]
+    for directed in (False, True):
+        graph = CSRGraph.from_edges(50, edges, directed=directed)
+        expected = {v: [] for v in range(1, 51)}
+        for v1, v2, w in edges:
+            expected[v1].append((v2, w))
+            if not directed:
+                expected[v2].append((v1, w))
+        assert all(sorted(graph[v]) == sorted(expected[v]) for v in expected)
+        assert graph.targets.typecode == 'i'
+
+    assert CSRGraph.from_edges(None, [(1, 2, 3)]).weights.typecode == 'i'
+    assert CSRGraph.from_edges(None, [(1, 2, 2 ** 40)]).weights.typecode == 'q'
+
+
+def test_from_edges_numpy_array_matches_edge_list():
+    import pytest
+
+    np = pytest.importorskip('numpy')
+    rng = np.random.default_rng(0)
+    vertices = rng.integers(1, 41, size=(200, 2))
+    for weights in (rng.integers(0, 10, size=200), rng.integers(0, 2 ** 40, size=200), rng.random(200)):
+        edges = np.column_stack((vertices, weights))
+        for directed in (False, True):
+            graph = CSRGraph.from_edges(None, edges, directed=directed)
+            expected = CSRGraph.from_edges(None, [(int(v1), int(v2), w) for v1, v2, w in edges.tolist()],
+                                           directed=directed)
+            assert graph.offsets == expected.offsets and graph.targets.typecode == 'i'
+            assert graph.weights.typecode == expected.weights.typecode
+            assert all(sorted(graph[v]) == sorted(expected[v]) for v in graph)
+
+    with pytest.raises(KeyError):
+        CSRGraph.from_edges(10, np.array([[1, 11, 3]]))
+    assert CSRGraph.from_edges(None, np.zeros((0, 3), dtype=np.int64)).num_vertices == 0
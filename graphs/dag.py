@@ -0,0 +1,254 @@
+from collections import deque
+
+
+class CycleError(Exception):
+    """Raised when a directed graph that should be acyclic contains a cycle.
+
+    Attributes:
+        cycle (list[int]): The vertices of one cycle in edge order, the first vertex repeated at the end.
+    """
+    def __init__(self, cycle: list[int]) -> None:
+        super().__init__(f"The graph contains a cycle: {' -> '.join(map(str, cycle))}.")
+        self.cycle = cycle
+
+
+def topological_layers(graph) -> list[list[int]]:
+    """Splits a DAG into layers with Kahn's algorithm.
+
+    The first layer holds every vertex without incoming edges, and every next layer holds the
+    vertices whose predecessors are all in earlier layers. The vertices of one layer do not depend
+    on each other, so for a job dependency graph each layer is a batch of tasks that can run in parallel.
+
+    Args:
+        graph (DirectedGraph | dict): The directed graph or its adjacency lists.
+
+    Returns:
+        list[list[int]]: The layers in dependency order.
+
+    Raises:
+        CycleError: If the graph contains a cycle.
+    """
+    adj_list = getattr(graph, 'graph', graph)
+    in_degree = dict.fromkeys(adj_list, 0)
+    for u in adj_list:
+        for v in adj_list[u]:
+            in_degree[v] += 1
+
+    layer = [v for v in adj_list if in_degree[v] == 0]
+    layers = []
+    placed = 0
+    while layer:
+        layers.append(layer)
+        placed += len(layer)
+        next_layer = []
+        for u in layer:
+            for v in adj_list[u]:
+                in_degree[v] -= 1
+                if in_degree[v] == 0:
+                    next_layer.append(v)
+        layer = next_layer
+
+    if placed != len(adj_list):
+        raise CycleError(_find_cycle(adj_list, in_degree))
+    return layers
+
+
+def topological_sort(graph) -> list[int]:
+    """Orders the vertices of a DAG so that every edge goes from an earlier to a later vertex.
+
+    Args:
+        graph (DirectedGraph | dict): The directed graph or its adjacency lists.
+
+    Returns:
+        list[int]: The vertices in topological order.
+
+    Raises:
+        CycleError: If the graph contains a cycle.
+    """
+    adj_list = getattr(graph, 'graph', graph)
+    in_degree = dict.fromkeys(adj_list, 0)
+    for u in adj_list:
+        for v in adj_list[u]:
+            in_degree[v] += 1
+
+    queue = deque(v for v in adj_list if in_degree[v] == 0)
+    order = []
+    while queue:
+        u = queue.popleft()
+        order.append(u)
+        for v in adj_list[u]:
+            in_degree[v] -= 1
+            if in_degree[v] == 0:
+                queue.append(v)
+
+    if len(order) != len(adj_list):
+        raise CycleError(_find_cycle(adj_list, in_degree))
+    return order
+
+
+def dag_shortest_paths(graph, source: int, weight) -> tuple[dict, dict]:
+    """Computes shortest distances from the source in a weighted DAG in O(V + E).
+
+    The vertices are relaxed once each, in topological order, so negative weights are allowed.
+
+    Args:
+        graph (DirectedGraph | dict): The DAG or its adjacency lists.
+        source (int): The starting vertex.
+        weight (Callable): weight(u, v) returns the weight of the edge u -> v.
+
+    Returns:
+        tuple: A tuple (dist, prev) of mappings like 'shortest_path_tree' returns.
+
+    Raises:
+        CycleError: If the graph contains a cycle.
+    """
+    return _dag_paths(graph, source, weight, longest=False)
+
+
+def dag_longest_paths(graph, source: int, weight) -> tuple[dict, dict]:
+    """Computes longest distances from the source in a weighted DAG in O(V + E).
+
+    Args:
+        graph (DirectedGraph | dict): The DAG or its adjacency lists.
+        source (int): The starting vertex.
+        weight (Callable): weight(u, v) returns the weight of the edge u -> v.
+
+    Returns:
+        tuple: A tuple (dist, prev), where unreachable vertices have distance '-inf'.
+
+    Raises:
+        CycleError: If the graph contains a cycle.
+    """
+    return _dag_paths(graph, source, weight, longest=True)
+
+
+def critical_path(graph, duration) -> tuple[float, list[int]]:
+    """Finds the critical path of a job dependency DAG.
+
+    An edge u -> v means that job v can only start after job u has finished. The critical
+    path is the chain of jobs with the largest total duration, which is the shortest
+    possible time to finish all jobs with unlimited workers.
+
+    Args:
+        graph (DirectedGraph | dict): The DAG or its adjacency lists.
+        duration (Callable): duration(v) returns how long job v takes.
+
+    Returns:
+        tuple[float, list[int]]: The total duration and the jobs on the critical path, in order.
+
+    Raises:
+        CycleError: If the graph contains a cycle.
+    """
+    adj_list = getattr(graph, 'graph', graph)
+    finish = {}
+    prev = dict.fromkeys(adj_list)
+    for u in topological_sort(adj_list):
+        finish[u] = finish.get(u, 0) + duration(u)
+        for v in adj_list[u]:
+            if finish[u] > finish.get(v, 0):
+                finish[v] = finish[u]
+                prev[v] = u
+
+    if not finish:
+        return 0, []
+    end = max(finish, key=finish.get)
+    path = []
+    vertex = end
+    while vertex is not None:
+        path.append(vertex)
+        vertex = prev[vertex]
+    path.reverse()
+    return finish[end], path
+
+
+def _dag_paths(graph, source: int, weight, longest: bool) -> tuple[dict, dict]:
+    """Relaxes every edge once in topological order for 'dag_shortest_paths' and 'dag_longest_paths'."""
+    adj_list = getattr(graph, 'graph', graph)
+    unreached = float('-inf') if longest else float('inf')
+    dist = dict.fromkeys(adj_list, unreached)
+    prev = dict.fromkeys(adj_list)
+    dist[source] = 0
+
+    for u in topological_sort(adj_list):
+        if dist[u] == unreached:
+            continue
+        for v in adj_list[u]:
+            new_dist = dist[u] + weight(u, v)
+            if (new_dist > dist[v]) if longest else (new_dist < dist[v]):
+                dist[v] = new_dist
+                prev[v] = u
+
+    return dist, prev
+
+
+def _find_cycle(adj_list, in_degree: dict) -> list[int]:
+    """Returns one cycle among the vertices that Kahn's algorithm could not place.
+
+    Every such vertex still has an incoming edge from another unplaced vertex, so walking
+    backwards along those edges must eventually repeat a vertex.
+    """
+    remaining = {v for v, degree in in_degree.items() if degree > 0}
+    predecessor = {}
+    for u in remaining:
+        for v in adj_list[u]:
+            if v in remaining:
+                predecessor.setdefault(v, u)
+
+    vertex = next(iter(remaining))
+    seen = {}
+    while vertex not in seen:
+        seen[vertex] = len(seen)
+        vertex = predecessor[vertex]
+
+    cycle = [vertex]
+    current = predecessor[vertex]
+    while current != vertex:
+        cycle.append(current)
+        current = predecessor[current]
+    cycle.append(vertex)
+    cycle.reverse()
+    return cycle
+
+
+def test_layers_paths_and_cycles():
+    import pytest
+
+    jobs = {1: [3], 2: [3], 3: [4, 5], 4: [6], 5: [6], 6: []}
+    durations = {1: 3, 2: 1, 3: 2, 4: 4, 5: 1, 6: 2}
+    assert topological_layers(jobs) == [[1, 2], [3], [4, 5], [6]]
+    order = topological_sort(jobs)
+    assert all(order.index(u) < order.index(v) for u in jobs for v in jobs[u])
+    assert critical_path(jobs, durations.get) == (11, [1, 3, 4, 6])
+
+    weights = {(1, 3): 2, (3, 4): -1, (3, 5): 4, (4, 6): 1, (5, 6): -6, (2, 3): 0}
+
+    def weight(u, v):
+        return weights[u, v]
+
+    assert dag_shortest_paths(jobs, 1, weight)[0] == {1: 0, 2: float('inf'), 3: 2, 4: 1, 5: 6, 6: 0}
+    assert dag_longest_paths(jobs, 1, weight)[0][6] == 2
+
+    jobs[6].append(3)
+    with pytest.raises(CycleError) as error:
+        topological_sort(jobs)
+    cycle = error.value.cycle
+    assert cycle[0] == cycle[-1] and set(cycle) <= {3, 4, 5, 6}
+
+
+if __name__ == "__main__":
+    from .graph_implementation import DirectedGraph
+
+    jobs = DirectedGraph(6)
+    for v1, v2 in ((1, 3), (2, 3), (3, 4), (3, 5), (4, 6), (5, 6)):
+        jobs.add_edge(v1, v2)
+    durations = {1: 3, 2: 1, 3: 2, 4: 4, 5: 1, 6: 2}
+
+    print("Order:", topological_sort(jobs))  # [1, 2, 3, 4, 5, 6]
+    print("Batches:", topological_layers(jobs))  # [[1, 2], [3], [4, 5], [6]]
+    print("Critical path:", critical_path(jobs, durations.get))  # (11, [1, 3, 4, 6])
+
+    jobs.add_edge(6, 3)
+    try:
+        topological_sort(jobs)
+    except CycleError as e:
+        print(e)
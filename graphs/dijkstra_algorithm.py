@@ -1,4 +1,8 @@
 import heapq
+from multiprocessing import Pool
+
+from .adjacency import as_adjacency
+from .indexed_heap import IndexedMinHeap
 
 
 def dijkstra(adj_matrix, start, end):
@@ -6,7 +10,8 @@ def dijkstra(adj_matrix, start, end):
 
     This function computes the shortest path from a given start node to a given end node
     in a weighted graph represented by an adjacency matrix. It uses a priority queue
-    to always expand the nearest unvisited node.
+    to always expand the nearest unvisited node, and stops as soon as the end node is
+    taken from the queue, because its distance can not improve after that.
 
     Args:
         adj_matrix (list[list[int]]): Adjacency matrix representing the graph.
@@ -29,6 +34,8 @@ def dijkstra(adj_matrix, start, end):
 
         if curr_dist > dist[u]:
             continue
+        if u == end:
+            break
 
         for v in range(n):
             weight = adj_matrix[u][v]
@@ -49,17 +56,307 @@ def dijkstra(adj_matrix, start, end):
     return path
 
 
-am = [
-    [0, 4, 4, 0, 0, 0],
-    [4, 0, 2, 0, 0, 0],
-    [4, 2, 0, 3, 1, 6],
-    [0, 0, 3, 0, 0, 2],
-    [0, 0, 1, 0, 0, 3],
-    [0, 0, 6, 2, 3, 0]
-]
+def shortest_path_tree(graph, start, queue='lazy', target=None, stats=None):
+    """Computes shortest distances from the start vertex over an adjacency-list graph.
+
+    Unlike 'dijkstra', this function never scans a full matrix row. Each popped vertex
+    only relaxes its own outgoing edges, so the total work is O((V + E) log V).
+    The graph can be a 'WeightedGraph' from 'weighted_graph.py' or 'graph_implementation.py',
+    a 'CSRGraph', or any adjacency mapping accepted by 'as_adjacency'.
+
+    Two priority queues are available:
+    - 'lazy': 'heapq' with duplicate entries, stale entries are skipped when popped.
+    - 'indexed': 'IndexedMinHeap' with a true decrease-key, so the queue never holds
+      more than V entries and no tuple is allocated per relaxation.
+
+    Args:
+        graph (WeightedGraph | CSRGraph | dict): The weighted graph.
+        start (int): The starting vertex.
+        queue (str): The priority queue to use, 'lazy' or 'indexed'.
+        target (int | None): If given, the search stops once the target vertex is settled.
+            The distances of the target and of every vertex on its path are final, other
+            vertices may keep tentative distances.
+        stats (dict | None): If given, 'max_queue' is set to the largest number of entries
+            the priority queue held during the search.
+
+    Returns:
+        tuple: A tuple (dist, prev), where:
+            - dist maps every vertex to its shortest distance from start ('inf' if unreachable),
+            - prev maps every vertex to its predecessor on the shortest path ('None' for start
+              and for unreachable vertices).
+
+    Raises:
+        ValueError: If the queue is not 'lazy' or 'indexed'.
+    """
+    adj_list = as_adjacency(graph)
+    dist = dict.fromkeys(adj_list, float('inf'))
+    prev = dict.fromkeys(adj_list)
+    dist[start] = 0
+
+    if queue == 'indexed':
+        max_queue = _relax_indexed(adj_list, start, dist, prev, target)
+    elif queue == 'lazy':
+        max_queue = _relax_lazy(adj_list, start, dist, prev, target)
+    else:
+        raise ValueError(f"Unknown queue {queue!r}, expected 'lazy' or 'indexed'.")
+
+    if stats is not None:
+        stats['max_queue'] = max_queue
+    return dist, prev
+
+
+def _relax_lazy(adj_list, start, dist, prev, target) -> int:
+    """Runs the main loop of 'shortest_path_tree' on a 'heapq' list and returns its largest size."""
+    pq = [(0, start)]
+    max_queue = 1
+
+    while pq:
+        if len(pq) > max_queue:
+            max_queue = len(pq)
+        curr_dist, u = heapq.heappop(pq)
+
+        if curr_dist > dist[u]:
+            continue
+        if u == target:
+            break
+
+        for v, weight in adj_list[u]:
+            new_dist = curr_dist + weight
+            if new_dist < dist[v]:
+                dist[v] = new_dist
+                prev[v] = u
+                heapq.heappush(pq, (new_dist, v))
+
+    return max_queue
+
+
+def _relax_indexed(adj_list, start, dist, prev, target) -> int:
+    """Runs the main loop of 'shortest_path_tree' on an 'IndexedMinHeap' and returns its largest size.
+
+    When the vertices are 1..n, as in 'WeightedGraph' and 'CSRGraph', they are used as heap
+    items directly. Other hashable vertex ids are mapped to their positions in adj_list,
+    which costs an extra list and dictionary of size V.
+    """
+    if all(vertex == i for i, vertex in enumerate(adj_list, start=1)):
+        vertices = index = range(len(adj_list) + 1)  # range(n + 1)[v] == v, without allocating
+    else:
+        vertices = list(adj_list)
+        index = {vertex: i for i, vertex in enumerate(vertices)}
+    pq = IndexedMinHeap(len(vertices))
+    pq.insert(index[start], 0)
+    max_queue = 1
+
+    while pq.size:
+        if pq.size > max_queue:
+            max_queue = pq.size
+        u = vertices[pq.pop()]
+        if u == target:
+            break
+        curr_dist = dist[u]
+
+        for v, weight in adj_list[u]:
+            new_dist = curr_dist + weight
+            if new_dist < dist[v]:
+                dist[v] = new_dist
+                prev[v] = u
+                i = index[v]
+                if i in pq:
+                    pq.decrease_key(i, new_dist)
+                else:
+                    pq.insert(i, new_dist)
+
+    return max_queue
+
+
+def build_path(dist, prev, end):
+    """Reconstructs the path to the end vertex from the result of 'shortest_path_tree'.
+
+    Args:
+        dist (dict[int, float]): Distance mapping returned by 'shortest_path_tree'.
+        prev (dict[int, int | None]): Predecessor mapping returned by 'shortest_path_tree'.
+        end (int): The target vertex.
+
+    Returns:
+        list[int]: The vertices from the start vertex to end, or an empty list
+        if end is unreachable.
+    """
+    path = []
+    if dist[end] == float('inf'):
+        return path
+
+    while end is not None:
+        path.append(end)
+        end = prev[end]
+    path.reverse()
+    return path
+
+
+def multi_source_dijkstra(graph, sources):
+    """Computes the distance from every vertex to its nearest source in one Dijkstra run.
+
+    All sources start in the queue with distance 0, as if a virtual vertex was connected
+    to each of them with a 0 edge. Every vertex is labelled with the source it was reached from,
+    so K facilities cost one search instead of K.
+
+    Args:
+        graph (WeightedGraph | CSRGraph | dict): The weighted graph.
+        sources (Iterable[int]): The source vertices.
+
+    Returns:
+        tuple: A tuple (dist, nearest, prev), where:
+            - dist maps every vertex to the distance to its nearest source ('inf' if none is reachable),
+            - nearest maps every vertex to that source ('None' if none is reachable),
+            - prev maps every vertex to its predecessor on the path from that source.
+    """
+    adj_list = as_adjacency(graph)
+    dist = dict.fromkeys(adj_list, float('inf'))
+    nearest = dict.fromkeys(adj_list)
+    prev = dict.fromkeys(adj_list)
+
+    pq = []
+    for source in sources:
+        dist[source] = 0
+        nearest[source] = source
+        pq.append((0, source))
+    heapq.heapify(pq)
+
+    while pq:
+        curr_dist, u = heapq.heappop(pq)
+        if curr_dist > dist[u]:
+            continue
+        for v, weight in adj_list[u]:
+            new_dist = curr_dist + weight
+            if new_dist < dist[v]:
+                dist[v] = new_dist
+                nearest[v] = nearest[u]
+                prev[v] = u
+                heapq.heappush(pq, (new_dist, v))
+
+    return dist, nearest, prev
+
+
+#  The graph of 'batch_shortest_paths' inside a worker process
+_shared = {}
+
+
+def _attach(graph) -> None:
+    """Pool initializer: stores the graph once per worker instead of once per task."""
+    _shared['graph'] = graph
+
+
+def _answer_source(task: tuple) -> list[tuple[float, list]]:
+    """Builds one shortest-path tree and answers every query of its source from it."""
+    source, targets = task
+    dist, prev = shortest_path_tree(_shared['graph'], source)
+    return [(dist[target], build_path(dist, prev, target)) for target in targets]
+
+
+def query_pool(graph, processes=None) -> Pool:
+    """Starts a process pool for 'batch_shortest_paths' with the graph already in every worker.
+
+    The graph is sent to each worker once, so a pool reused for many batches pays
+    for the process starts and the graph transfer only once.
+
+    Args:
+        graph (WeightedGraph | CSRGraph | dict): The weighted graph.
+        processes (int | None): The number of worker processes, 'os.cpu_count()' by default.
+
+    Returns:
+        Pool: The pool, to be closed by the caller, e.g. with a 'with' statement.
+    """
+    return Pool(processes, initializer=_attach, initargs=(graph,))
+
+
+def batch_shortest_paths(graph, queries, processes=None, pool=None) -> list[tuple[float, list]]:
+    """Answers many (source, target) queries, computing each source tree only once.
+
+    The queries are grouped by source, one 'shortest_path_tree' is built per distinct
+    source, and all targets of that source are read from it. The trees are built in a
+    process pool if processes or pool is given.
+
+    Args:
+        graph (WeightedGraph | CSRGraph | dict): The weighted graph.
+        queries (Iterable[tuple[int, int]]): The (source, target) pairs.
+        processes (int | None): The number of worker processes of a pool started for this call,
+            or 'None' to run in this process.
+        pool (Pool | None): A pool from 'query_pool' for the same graph, reused instead of starting one.
+
+    Returns:
+        list[tuple[float, list]]: The (distance, path) of every query, in the order of the queries.
+    """
+    queries = list(queries)
+    by_source = {}
+    for i, (source, target) in enumerate(queries):
+        by_source.setdefault(source, []).append(i)
+    tasks = [(source, [queries[i][1] for i in positions]) for source, positions in by_source.items()]
+
+    if pool is not None:
+        results = pool.map(_answer_source, tasks)
+    elif processes is None:
+        _attach(graph)
+        results = map(_answer_source, tasks)
+    else:
+        with query_pool(graph, processes) as pool:
+            results = pool.map(_answer_source, tasks)
+
+    answers = [None] * len(queries)
+    for positions, answered in zip(by_source.values(), results):
+        for i, answer in zip(positions, answered):
+            answers[i] = answer
+    return answers
+
+
+def test_indexed_queue_matches_lazy_queue():
+    from random import Random
+
+    rng = Random(0)
+    graph = {v: [] for v in range(1, 201)}
+    for _ in range(600):
+        u, v, w = rng.randint(1, 200), rng.randint(1, 200), rng.randint(1, 20)
+        graph[u].append((v, w))
+        graph[v].append((u, w))
+
+    lazy_stats, indexed_stats = {}, {}
+    lazy_dist, _ = shortest_path_tree(graph, 1, stats=lazy_stats)
+    indexed_dist, _ = shortest_path_tree(graph, 1, queue='indexed', stats=indexed_stats)
+    assert indexed_dist == lazy_dist
+    assert indexed_stats['max_queue'] <= len(graph) and lazy_stats['max_queue'] >= indexed_stats['max_queue']
+
+    named = {'a': [('b', 1), ('c', 5)], 'b': [('c', 2)], 'c': []}
+    assert shortest_path_tree(named, 'a', queue='indexed')[0] == {'a': 0, 'b': 1, 'c': 3}
+
+
+def test_multi_source_and_batch_match_single_source():
+    graph = {1: [(2, 3)], 2: [(1, 3), (3, 1)], 3: [(2, 1), (4, 5)], 4: [(3, 5)], 5: []}
+
+    dist, nearest, prev = multi_source_dijkstra(graph, [1, 4])
+    assert dist == {1: 0, 2: 3, 3: 4, 4: 0, 5: float('inf')}
+    assert nearest == {1: 1, 2: 1, 3: 1, 4: 4, 5: None} and prev[3] == 2
+
+    queries = [(1, 4), (3, 1), (1, 3), (2, 5)]
+    expected = []
+    for source, target in queries:
+        single_dist, single_prev = shortest_path_tree(graph, source)
+        expected.append((single_dist[target], build_path(single_dist, single_prev, target)))
+    assert batch_shortest_paths(graph, queries) == expected
+    assert batch_shortest_paths(graph, queries, processes=2) == expected
+    with query_pool(graph, 2) as pool:
+        assert batch_shortest_paths(graph, queries, pool=pool) == expected
+        assert batch_shortest_paths(graph, queries[::-1], pool=pool) == expected[::-1]
+
+
+if __name__ == "__main__":
+    am = [
+        [0, 4, 4, 0, 0, 0],
+        [4, 0, 2, 0, 0, 0],
+        [4, 2, 0, 3, 1, 6],
+        [0, 0, 3, 0, 0, 2],
+        [0, 0, 1, 0, 0, 3],
+        [0, 0, 6, 2, 3, 0]
+    ]
 
-a, b = (int(x) for x in input().split())
+    a, b = (int(x) for x in input().split())
 
-short_path = dijkstra(am, a, b)
+    short_path = dijkstra(am, a, b)
 
-print(f"A shortest path from {a} to {b} is: {' '.join(short_path)}.")
+    print(f"A shortest path from {a} to {b} is: {' '.join(short_path)}.")
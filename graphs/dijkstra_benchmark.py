@@ -0,0 +1,58 @@
+import random
+import time
+
+from .dijkstra_algorithm import shortest_path_tree
+
+
+def random_graph(num_vertices: int, num_edges: int, max_weight: int = 100, seed: int = 0) -> dict:
+    """Builds a random undirected weighted graph as an adjacency list.
+
+    Args:
+        num_vertices (int): The number of vertices, numbered from 1.
+        num_edges (int): The number of random edges to add.
+        max_weight (int): The largest edge weight.
+        seed (int): The seed of the random generator.
+
+    Returns:
+        dict[int, list[tuple[int, int]]]: The generated adjacency list.
+    """
+    rng = random.Random(seed)
+    graph = {i: [] for i in range(1, num_vertices + 1)}
+    for _ in range(num_edges):
+        u = rng.randint(1, num_vertices)
+        v = rng.randint(1, num_vertices)
+        w = rng.randint(1, max_weight)
+        graph[u].append((v, w))
+        graph[v].append((u, w))
+    return graph
+
+
+def measure(graph: dict, start: int, queue: str, repeat: int = 3) -> tuple[float, int]:
+    """Runs 'shortest_path_tree' a few times and measures it.
+
+    Args:
+        graph (dict): The adjacency list.
+        start (int): The starting vertex.
+        queue (str): The priority queue passed to 'shortest_path_tree'.
+        repeat (int): The number of runs, the fastest one is reported.
+
+    Returns:
+        tuple[float, int]: Wall-clock seconds and the largest number of entries in the priority queue.
+    """
+    elapsed = float('inf')
+    stats = {}
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        shortest_path_tree(graph, start, queue=queue, stats=stats)
+        elapsed = min(elapsed, time.perf_counter() - begin)
+    return elapsed, stats['max_queue']
+
+
+if __name__ == "__main__":
+    """Compares the lazy-deletion 'heapq' queue with 'IndexedMinHeap' on sparse and dense graphs."""
+    for num_vertices, num_edges in ((100_000, 300_000), (2_000, 1_000_000)):
+        graph = random_graph(num_vertices, num_edges)
+        print(f"V={num_vertices}, E={num_edges}")
+        for queue in ('lazy', 'indexed'):
+            elapsed, max_queue = measure(graph, 1, queue)
+            print(f"  {queue:>8}: {elapsed:.3f} s, peak queue size {max_queue} entries")
@@ -0,0 +1,102 @@
+from array import array
+from collections.abc import Iterable
+
+
+class DisjointSet:
+    """Represents a disjoint-set (union-find) structure over the elements 0..size-1.
+
+    The whole structure is a single 'array('i')' of 4 bytes per element:
+    - parent[x] >= 0 is the parent of x,
+    - parent[x] < 0 marks x as a root, and -parent[x] is the size of its component.
+    'find' uses path halving and 'union' attaches the smaller component to the larger one,
+    so every operation runs in near-constant amortized time.
+    """
+    def __init__(self, size: int) -> None:
+        """Initializes size single-element components.
+
+        Args:
+            size (int): The number of elements.
+        """
+        self.parent = array('i', [-1]) * size
+        self.count = size
+
+    def __len__(self) -> int:
+        """Returns the number of elements."""
+        return len(self.parent)
+
+    def find(self, x: int) -> int:
+        """Returns the root of the component that contains x.
+
+        Args:
+            x (int): The given element.
+
+        Returns:
+            int: The root element of the component.
+        """
+        parent = self.parent
+        while parent[x] >= 0:
+            grandparent = parent[parent[x]]
+            if grandparent < 0:
+                return parent[x]
+            parent[x] = grandparent  # Path halving
+            x = grandparent
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        """Merges the components that contain x and y.
+
+        Args:
+            x (int): The first element.
+            y (int): The second element.
+
+        Returns:
+            bool: True if two different components were merged, False if x and y were already connected.
+        """
+        root_x, root_y = self.find(x), self.find(y)
+        if root_x == root_y:
+            return False
+        parent = self.parent
+        if parent[root_x] > parent[root_y]:  # Sizes are negative, so root_x has the smaller component
+            root_x, root_y = root_y, root_x
+        parent[root_x] += parent[root_y]
+        parent[root_y] = root_x
+        self.count -= 1
+        return True
+
+    def union_many(self, pairs: Iterable[tuple[int, int]]) -> int:
+        """Merges the components of every given pair of elements.
+
+        Args:
+            pairs (Iterable[tuple[int, int]]): The pairs of elements to connect.
+
+        Returns:
+            int: The number of merges that joined two different components.
+        """
+        union = self.union
+        return sum(union(x, y) for x, y in pairs)
+
+    def connected(self, x: int, y: int) -> bool:
+        """Checks if x and y are in the same component.
+
+        Returns:
+            bool: True if x and y are connected, False otherwise.
+        """
+        return self.find(x) == self.find(y)
+
+    def component_size(self, x: int) -> int:
+        """Returns the number of elements in the component that contains x."""
+        return -self.parent[self.find(x)]
+
+
+def test_union_by_size_and_path_halving():
+    sets = DisjointSet(10)
+    assert sets.union_many([(0, 1), (2, 3), (1, 3), (3, 0), (5, 6)]) == 4
+    assert sets.count == 6 and len(sets) == 10
+    assert sets.connected(0, 2) and not sets.connected(0, 5)
+    assert sets.component_size(2) == 4 and sets.component_size(9) == 1
+
+    for x in range(1, 10):
+        sets.union(x - 1, x)
+    assert sets.count == 1 and sets.component_size(4) == 10
+    root = sets.find(9)
+    assert all(sets.find(x) == root for x in range(10)) and sets.parent[root] == -10
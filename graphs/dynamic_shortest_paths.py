@@ -0,0 +1,275 @@
+import heapq
+
+from .adjacency import as_adjacency
+from .dijkstra_algorithm import build_path, shortest_path_tree
+from .floyd_algorithm import floyd
+
+
+class DynamicShortestPaths:
+    """Represents a single-source shortest-path tree that is repaired after every edge update.
+
+    The tree is computed once by 'shortest_path_tree'. After that, every change of an edge
+    goes through this class, and only the vertices whose distance can change are recomputed:
+    - a lower weight or a new edge starts Dijkstra's algorithm from the improved vertex and only
+      reaches the vertices that get closer,
+    - a higher weight or a removed tree edge resets the subtree below that edge, seeds it from
+      its unaffected neighbours and runs Dijkstra's algorithm inside the subtree only.
+    The graph must be an undirected 'WeightedGraph' from 'weighted_graph.py' with non-negative weights.
+    """
+    def __init__(self, graph, source: int) -> None:
+        """Computes the initial shortest-path tree.
+
+        Args:
+            graph (WeightedGraph): The graph, its edges must only be changed through this object.
+            source (int): The source vertex of the tree.
+        """
+        self.graph = graph
+        self.source = source
+        self.dist, self.prev = shortest_path_tree(graph, source)
+        #  The children of every vertex in the tree, kept in step with 'prev' so that the
+        #  subtree below a changed edge is found without scanning all vertices
+        self.children = {vertex: set() for vertex in self.prev}
+        for vertex, parent in self.prev.items():
+            if parent is not None:
+                self.children[parent].add(vertex)
+
+    def distance(self, target: int) -> float:
+        """Returns the shortest distance from the source to target."""
+        return self.dist[target]
+
+    def path(self, target: int) -> list[int]:
+        """Returns the shortest path from the source to target, or an empty list if it is unreachable."""
+        return build_path(self.dist, self.prev, target)
+
+    def update_edge(self, vertex1: int, vertex2: int, weight: int) -> None:
+        """Sets the weight of the edge between vertex1 and vertex2 and repairs the tree.
+
+        Args:
+            vertex1 (int): The first vertex.
+            vertex2 (int): The second vertex.
+            weight (int): The new weight of the edge.
+        """
+        old_weight = self.graph.graph[vertex1].get(vertex2)
+        self.graph.add_edge(vertex1, vertex2, weight)
+        if old_weight is None or weight < old_weight:
+            self._decrease(vertex1, vertex2, weight)
+            self._decrease(vertex2, vertex1, weight)
+        elif weight > old_weight:
+            self._increase(vertex1, vertex2)
+
+    def remove_edge(self, vertex1: int, vertex2: int) -> None:
+        """Removes the edge between vertex1 and vertex2 and repairs the tree.
+
+        Args:
+            vertex1 (int): The first vertex.
+            vertex2 (int): The second vertex.
+        """
+        self.graph.remove_edge(vertex1, vertex2)
+        self._increase(vertex1, vertex2)
+
+    def _decrease(self, u: int, v: int, weight: int) -> None:
+        """Repairs the tree after the edge u -> v got cheaper."""
+        if self.dist[u] + weight < self.dist[v]:
+            self.dist[v] = self.dist[u] + weight
+            self._set_parent(v, u)
+            self._propagate([(self.dist[v], v)])
+
+    def _increase(self, u: int, v: int) -> None:
+        """Repairs the tree after the edge u - v got more expensive or was removed."""
+        if self.prev[v] == u:
+            child = v
+        elif self.prev[u] == v:
+            child = u
+        else:
+            return  # The edge is not in the tree, so no shortest distance uses it
+
+        affected = set()
+        stack = [child]
+        while stack:
+            vertex = stack.pop()
+            affected.add(vertex)
+            stack.extend(self.children[vertex])
+
+        for vertex in affected:
+            self.dist[vertex] = float('inf')
+            self._set_parent(vertex, None)
+
+        adj_list = as_adjacency(self.graph)
+        pq = []
+        for vertex in affected:
+            for neighbour, weight in adj_list[vertex]:
+                if neighbour not in affected and self.dist[neighbour] + weight < self.dist[vertex]:
+                    self.dist[vertex] = self.dist[neighbour] + weight
+                    self._set_parent(vertex, neighbour)
+            if self.dist[vertex] < float('inf'):
+                pq.append((self.dist[vertex], vertex))
+        heapq.heapify(pq)
+        self._propagate(pq)
+
+    def _propagate(self, pq: list) -> None:
+        """Runs Dijkstra's main loop from the given queue over the current distances."""
+        adj_list = as_adjacency(self.graph)
+        dist, prev, children = self.dist, self.prev, self.children
+        while pq:
+            curr_dist, u = heapq.heappop(pq)
+            if curr_dist > dist[u]:
+                continue
+            for v, weight in adj_list[u]:
+                new_dist = curr_dist + weight
+                if new_dist < dist[v]:
+                    dist[v] = new_dist
+                    if prev[v] is not None:
+                        children[prev[v]].discard(v)
+                    prev[v] = u
+                    children[u].add(v)
+                    heapq.heappush(pq, (new_dist, v))
+
+    def _set_parent(self, vertex: int, parent: int | None) -> None:
+        """Moves vertex below parent in the tree, or detaches it if parent is 'None'."""
+        old_parent = self.prev[vertex]
+        if old_parent is not None:
+            self.children[old_parent].discard(vertex)
+        self.prev[vertex] = parent
+        if parent is not None:
+            self.children[parent].add(vertex)
+
+
+class DynamicAllPairs:
+    """Represents a Floyd-Warshall all-pairs result that is repaired after every edge update.
+
+    - A lower weight or a new edge u -> v is applied in O(n^2) without rerunning 'floyd':
+      a pair (i, j) improves only through i -> u -> v -> j, and only rows i that reach v
+      faster through the new edge are scanned.
+    - A higher weight or a removed edge only recomputes the rows whose shortest-path tree
+      uses that edge, each with one O(n^2) Dijkstra run over the matrix.
+    The matrices follow the conventions of 'floyd', so 'reconstruct_path' works on 'pred'.
+    Unlike 'floyd', the weights must be non-negative, since the rows are recomputed with Dijkstra.
+    """
+    def __init__(self, adj_matrix) -> None:
+        """Copies the adjacency matrix and computes the initial all-pairs result.
+
+        Args:
+            adj_matrix (list[list[int]]): Adjacency matrix representing the graph, 0 means no edge.
+
+        Raises:
+            ValueError: If a weight is negative.
+        """
+        if any(weight < 0 for row in adj_matrix for weight in row):
+            raise ValueError("The weights must be non-negative.")
+        self.matrix = [list(row) for row in adj_matrix]
+        self.dist, self.pred = floyd(self.matrix)
+
+    def update_edge(self, u: int, v: int, weight: int, directed: bool = False) -> None:
+        """Sets the weight of the edge u -> v (and v -> u unless directed) and repairs the result.
+
+        Args:
+            u (int): The first node.
+            v (int): The second node.
+            weight (int): The new non-negative weight, 0 removes the edge.
+            directed (bool): If False, the edge v -> u gets the same weight.
+
+        Raises:
+            ValueError: If the weight is negative.
+        """
+        if weight < 0:
+            raise ValueError(f"The weights must be non-negative, got {weight}.")
+        edges = [(u, v)] if directed else [(u, v), (v, u)]
+        increased, decreased = [], []
+        for a, b in edges:
+            old = self.matrix[a][b]
+            self.matrix[a][b] = weight
+            if old != 0 and (weight == 0 or weight > old):
+                increased.append((a, b))
+            elif weight != 0 and (old == 0 or weight < old):
+                decreased.append((a, b))
+
+        #  The recomputed rows already see the new weights, the others are fixed by '_decrease'
+        rows = {i for i in range(len(self.dist)) for a, b in increased if self.pred[i][b] == a}
+        for i in rows:
+            self.dist[i], self.pred[i] = self._row(i)
+        for a, b in decreased:
+            self._decrease(a, b, weight)
+
+    def _decrease(self, u: int, v: int, weight: int) -> None:
+        """Applies the cheaper edge u -> v to every pair in O(n^2)."""
+        dist, pred = self.dist, self.pred
+        n = len(dist)
+        dist_v = dist[v]
+        pred_v = pred[v]
+        for i in range(n):
+            via = dist[i][u] + weight
+            if via >= dist[i][v]:
+                continue
+            row, pred_row = dist[i], pred[i]
+            for j in range(n):
+                if via + dist_v[j] < row[j]:
+                    row[j] = via + dist_v[j]
+                    pred_row[j] = u if j == v else pred_v[j]
+
+    def _row(self, source: int) -> tuple[list, list]:
+        """Recomputes one row of dist and pred with Dijkstra's algorithm over the matrix."""
+        n = len(self.matrix)
+        dist = [float('inf')] * n
+        pred = [None] * n
+        dist[source] = 0
+        pq = [(0, source)]
+        while pq:
+            curr_dist, u = heapq.heappop(pq)
+            if curr_dist > dist[u]:
+                continue
+            for v, weight in enumerate(self.matrix[u]):
+                if weight != 0 and curr_dist + weight < dist[v]:
+                    dist[v] = curr_dist + weight
+                    pred[v] = u
+                    heapq.heappush(pq, (dist[v], v))
+        return dist, pred
+
+
+def test_repairs_match_recomputation():
+    from random import Random
+
+    from .weighted_graph import WeightedGraph
+
+    rng = Random(0)
+    graph = WeightedGraph(num_vertices=60)
+    for _ in range(150):
+        v1, v2 = rng.sample(range(1, 61), 2)
+        graph.add_edge(v1, v2, rng.randint(1, 20))
+    tree = DynamicShortestPaths(graph, 1)
+
+    for _ in range(300):
+        v1, v2 = rng.sample(range(1, 61), 2)
+        if rng.random() < 0.3:
+            tree.remove_edge(v1, v2)
+        else:
+            tree.update_edge(v1, v2, rng.randint(1, 20))
+        assert tree.dist == shortest_path_tree(graph, 1)[0]
+        assert tree.children == {v: {c for c, p in tree.prev.items() if p == v} for v in tree.prev}
+
+
+def test_all_pairs_repairs_match_floyd():
+    from random import Random
+
+    import pytest
+
+    from .floyd_algorithm import reconstruct_path
+
+    rng = Random(1)
+    n = 25
+    matrix = [[0] * n for _ in range(n)]
+    for _ in range(60):
+        u, v = rng.sample(range(n), 2)
+        matrix[u][v] = matrix[v][u] = rng.randint(1, 20)
+    paths = DynamicAllPairs(matrix)
+
+    for _ in range(200):
+        u, v = rng.sample(range(n), 2)
+        weight = 0 if rng.random() < 0.3 else rng.randint(1, 20)
+        paths.update_edge(u, v, weight, directed=rng.random() < 0.5)
+        assert paths.dist == floyd(paths.matrix)[0]
+        for a, b in rng.sample([(a, b) for a in range(n) for b in range(n) if a != b], 10):
+            path = [int(x) for x in reconstruct_path(paths.pred, a, b)]
+            assert not path or sum(paths.matrix[x][y] for x, y in zip(path, path[1:])) == paths.dist[a][b]
+
+    with pytest.raises(ValueError):
+        paths.update_edge(0, 1, -1)
@@ -1,24 +1,57 @@
-def floyd(adj_matrix):
+try:
+    import numpy as np
+except ImportError:  # the pure Python mode does not need NumPy
+    np = None
+
+
+def floyd(adj_matrix, mode='python', block_size=256, no_edge=0):
     """Computes shortest paths between all pairs of nodes using Floyd-Warshall algorithm.
 
     The function returns two matrices:
     - dist: matrix of shortest distances
     - pred: matrix of predecessors to reconstruct shortest paths
 
+    Three modes are available:
+    - 'python': the classic triple loop over nested lists.
+    - 'numpy': every k-step is a single broadcasted 'np.minimum' over the whole matrix.
+    - 'blocked': the same NumPy updates applied tile by tile (block_size x block_size),
+      so the working set of every step stays in the CPU cache for large matrices.
+    The NumPy modes return NumPy arrays, and a missing predecessor is marked with -1 instead of 'None'.
+
     Args:
         adj_matrix (list[list[int]]): Adjacency matrix representing the graph.
             A 0 (except on diagonal) indicates no direct edge.
+        mode (str): 'python', 'numpy' or 'blocked'.
+        block_size (int): The tile size of the 'blocked' mode.
+        no_edge (float): The matrix value that marks a missing edge. Pass float('inf')
+            to keep 0-weight edges.
 
     Returns:
         tuple: A tuple (dist, pred), where:
             - dist is a 2D list of shortest path distances,
             - pred is a 2D list of predecessors for path reconstruction.
+
+    Raises:
+        ValueError: If the mode is unknown.
+        ImportError: If a NumPy mode is requested and NumPy is not installed.
     """
+    if mode in ('numpy', 'blocked'):
+        if np is None:
+            raise ImportError(f"Mode {mode!r} requires NumPy.")
+        dist, pred = _init_arrays(adj_matrix, no_edge)
+        if mode == 'numpy':
+            _floyd_vectorized(dist, pred)
+        else:
+            _floyd_blocked(dist, pred, block_size)
+        return dist, pred
+    if mode != 'python':
+        raise ValueError(f"Unknown mode {mode!r}, expected 'python', 'numpy' or 'blocked'.")
+
     n = len(adj_matrix)
 
-    dist = [[float('inf') if i != j and adj_matrix[i][j] == 0 else adj_matrix[i][j]
+    dist = [[float('inf') if i != j and adj_matrix[i][j] == no_edge else adj_matrix[i][j]
              for j in range(n)] for i in range(n)]
-    pred = [[None if i == j or adj_matrix[i][j] == 0 else i
+    pred = [[None if i == j or adj_matrix[i][j] == no_edge else i
              for j in range(n)] for i in range(n)]
 
     for k in range(n):
@@ -31,11 +64,74 @@ def floyd(adj_matrix):
     return dist, pred
 
 
+def _init_arrays(adj_matrix, no_edge=0):
+    """Builds the initial NumPy dist and pred matrices with the same rules as the 'python' mode."""
+    weights = np.asarray(adj_matrix, dtype=np.float64)
+    n = len(weights)
+    missing = (weights == no_edge) | np.eye(n, dtype=bool)
+
+    dist = np.where(missing, np.inf, weights)
+    np.fill_diagonal(dist, np.diagonal(weights))
+    pred = np.repeat(np.arange(n, dtype=np.int64)[:, None], n, axis=1)
+    pred[missing] = -1
+    return dist, pred
+
+
+def _floyd_vectorized(dist, pred):
+    """Runs Floyd-Warshall in place, one broadcasted update of the whole matrix per k."""
+    for k in range(len(dist)):
+        via_k = dist[:, k, None] + dist[None, k, :]
+        improved = via_k < dist
+        np.minimum(dist, via_k, out=dist)
+        np.copyto(pred, pred[k], where=improved)
+
+
+def _update_tile(dist, pred, rows, cols, ks):
+    """Relaxes the tile dist[rows, cols] through every vertex k of ks, in order.
+
+    The tile is a view, so later k-steps and later tiles see the updated values.
+    """
+    tile = dist[rows, cols]
+    tile_pred = pred[rows, cols]
+    for k in range(ks.start, ks.stop):
+        via_k = dist[rows, k, None] + dist[None, k, cols]
+        improved = via_k < tile
+        np.minimum(tile, via_k, out=tile)
+        np.copyto(tile_pred, pred[k, cols], where=improved)
+
+
+def _floyd_blocked(dist, pred, block_size):
+    """Runs the cache-blocked Floyd-Warshall in place.
+
+    For every diagonal block K the tiles are processed in three phases:
+    1. the diagonal tile (K, K),
+    2. the tiles in the row and the column of K, which only depend on phase 1,
+    3. all remaining tiles, which only depend on phase 2.
+    """
+    n = len(dist)
+    blocks = [slice(start, min(start + block_size, n)) for start in range(0, n, block_size)]
+
+    for kb in blocks:
+        _update_tile(dist, pred, kb, kb, kb)
+
+        for other in blocks:
+            if other != kb:
+                _update_tile(dist, pred, kb, other, kb)
+                _update_tile(dist, pred, other, kb, kb)
+
+        for rows in blocks:
+            if rows == kb:
+                continue
+            for cols in blocks:
+                if cols != kb:
+                    _update_tile(dist, pred, rows, cols, kb)
+
+
 def reconstruct_path(pred, a, b):
     """Reconstructs shortest path from node a to b using predecessor matrix.
 
     Args:
-        pred (list[list[int]]): Predecessor matrix from Floyd-Warshall.
+        pred (list[list[int]]): Predecessor matrix from Floyd-Warshall, 'None' or -1 marks no predecessor.
         a (int): Start node.
         b (int): End node.
 
@@ -43,7 +139,7 @@ def reconstruct_path(pred, a, b):
         list: The list of nodes representing the shortest path from a to b.
     """
     path = []
-    if pred[a][b] is None:
+    if pred[a][b] is None or pred[a][b] == -1:
         return path
     while b != a:
         path.insert(0, b)
@@ -52,19 +148,162 @@ def reconstruct_path(pred, a, b):
     return list(map(str, path))
 
 
-am = [
-    [0, 4, 4, 0, 0, 0],
-    [4, 0, 2, 0, 0, 0],
-    [4, 2, 0, 3, 1, 6],
-    [0, 0, 3, 0, 0, 2],
-    [0, 0, 1, 0, 0, 3],
-    [0, 0, 6, 2, 3, 0]
-]
+def _matrix_files(path):
+    """Returns the file names of the dist and pred matrices stored under the given path prefix."""
+    return f"{path}.dist.npy", f"{path}.pred.npy"
+
+
+def _open_result_files(path, n):
+    """Creates the float32 dist and int32 pred memory-mapped matrices of size n x n."""
+    dist_file, pred_file = _matrix_files(path)
+    dist = np.lib.format.open_memmap(dist_file, mode='w+', dtype=np.float32, shape=(n, n))
+    pred = np.lib.format.open_memmap(pred_file, mode='w+', dtype=np.int32, shape=(n, n))
+    return dist, pred
+
+
+def floyd_to_disk(adj_matrix, path, block_size=256, no_edge=0):
+    """Runs the blocked Floyd-Warshall directly on memory-mapped matrices in files.
+
+    The result is stored as '<path>.dist.npy' (float32, 'inf' for no path) and
+    '<path>.pred.npy' (int32, -1 for no predecessor), which take 8 bytes per pair instead
+    of two Python objects. The matrices are filled row by row, so the whole n x n result
+    never has to fit in memory. Use 'FloydIndex' to query the files later.
+
+    Args:
+        adj_matrix (list[list[int]]): Adjacency matrix representing the graph.
+        path (str): The path prefix of the output files.
+        block_size (int): The tile size of the blocked algorithm.
+        no_edge (float): The matrix value that marks a missing edge.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError("Memory-mapped results require NumPy.")
+    n = len(adj_matrix)
+    dist, pred = _open_result_files(path, n)
+
+    for i in range(n):
+        weights = np.asarray(adj_matrix[i], dtype=np.float64)
+        missing = weights == no_edge
+        missing[i] = True
+        dist[i] = np.where(missing, np.inf, weights)
+        dist[i, i] = weights[i]
+        pred[i] = np.where(missing, -1, i)
+
+    _floyd_blocked(dist, pred, block_size)
+    dist.flush()
+    pred.flush()
+
+
+def save_floyd_result(dist, pred, path):
+    """Writes an already computed 'floyd' result into compact memory-mapped files.
+
+    Args:
+        dist (list[list[float]]): The dist matrix returned by 'floyd'.
+        pred (list[list[int]]): The pred matrix returned by 'floyd', 'None' or -1 for no predecessor.
+        path (str): The path prefix of the output files, see 'floyd_to_disk'.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    if np is None:
+        raise ImportError("Memory-mapped results require NumPy.")
+    dist_out, pred_out = _open_result_files(path, len(dist))
+    for i in range(len(dist)):
+        dist_out[i] = dist[i]
+        pred_out[i] = [-1 if p is None else p for p in pred[i]]
+    dist_out.flush()
+    pred_out.flush()
+
+
+class FloydIndex:
+    """Represents read-only access to a Floyd-Warshall result stored by 'floyd_to_disk'.
+
+    The matrices are memory-mapped, so opening the index reads nothing, the operating system
+    loads only the pages touched by the queries, and every process opening the same files
+    shares one copy of them in the page cache.
+    """
+    def __init__(self, path: str) -> None:
+        """Opens the stored dist and pred matrices.
+
+        Args:
+            path (str): The path prefix used when the result was stored.
+        """
+        if np is None:
+            raise ImportError("Memory-mapped results require NumPy.")
+        dist_file, pred_file = _matrix_files(path)
+        self.dist = np.load(dist_file, mmap_mode='r')
+        self.pred = np.load(pred_file, mmap_mode='r')
+
+    def __len__(self) -> int:
+        """Returns the number of nodes in the stored graph."""
+        return len(self.dist)
+
+    def distance(self, a: int, b: int) -> float:
+        """Returns the shortest distance from node a to node b, 'inf' if there is no path."""
+        return float(self.dist[a, b])
+
+    def path(self, a: int, b: int) -> list[str]:
+        """Returns the shortest path from node a to node b like 'reconstruct_path'."""
+        return reconstruct_path(self.pred, a, b)
+
+
+def _random_matrix(size, seed):
+    """Returns a sparse random adjacency matrix for the tests."""
+    from random import Random
+
+    rng = Random(seed)
+    return [[rng.randint(1, 30) if i != j and rng.random() < 0.15 else 0 for j in range(size)]
+            for i in range(size)]
+
+
+def test_numpy_modes_match_python_mode():
+    import pytest
+
+    pytest.importorskip('numpy')
+    matrix = _random_matrix(37, seed=5)
+    dist, pred = floyd(matrix)
+    for mode in ('numpy', 'blocked'):
+        fast_dist, fast_pred = floyd(matrix, mode=mode, block_size=8)
+        assert np.array_equal(fast_dist, np.array(dist, dtype=float))
+        for a, b in ((0, 36), (5, 20), (36, 1)):
+            path = [int(v) for v in reconstruct_path(fast_pred, a, b)]
+            assert bool(path) == bool(reconstruct_path(pred, a, b))
+            assert not path or sum(matrix[u][v] for u, v in zip(path, path[1:])) == dist[a][b]
+    with pytest.raises(ValueError):
+        floyd(matrix, mode='fortran')
+
+
+def test_results_on_disk(tmp_path):
+    import pytest
+
+    pytest.importorskip('numpy')
+    matrix = _random_matrix(21, seed=8)
+    dist, pred = floyd(matrix)
+    floyd_to_disk(matrix, str(tmp_path / "blocked"), block_size=4)
+    save_floyd_result(dist, pred, str(tmp_path / "saved"))
+
+    for index in (FloydIndex(str(tmp_path / "blocked")), FloydIndex(str(tmp_path / "saved"))):
+        assert len(index) == 21 and index.dist.dtype == np.float32 and index.pred.dtype == np.int32
+        assert all(index.distance(a, b) == dist[a][b] for a in range(21) for b in range(21))
+        assert bool(index.path(0, 20)) == bool(reconstruct_path(pred, 0, 20))
+
+
+if __name__ == "__main__":
+    am = [
+        [0, 4, 4, 0, 0, 0],
+        [4, 0, 2, 0, 0, 0],
+        [4, 2, 0, 3, 1, 6],
+        [0, 0, 3, 0, 0, 2],
+        [0, 0, 1, 0, 0, 3],
+        [0, 0, 6, 2, 3, 0]
+    ]
 
-a, b = (int(x) for x in input().split())
+    a, b = (int(x) for x in input().split())
 
-dist, pred = floyd(am)
+    dist, pred = floyd(am)
 
-short_path = reconstruct_path(pred, a, b)
+    short_path = reconstruct_path(pred, a, b)
 
-print(f"A shortest path from {a} to {b} is: {' '.join(short_path)}.")
+    print(f"A shortest path from {a} to {b} is: {' '.join(short_path)}.")
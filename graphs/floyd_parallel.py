@@ -0,0 +1,127 @@
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from .floyd_algorithm import _init_arrays, _update_tile
+
+#  NumPy views of the shared dist and pred matrices inside a worker process
+_shared = {}
+
+
+def _attach(dist_name: str, pred_name: str, n: int) -> None:
+    """Pool initializer: maps the shared dist and pred buffers into the worker process."""
+    dist_shm = SharedMemory(name=dist_name)
+    pred_shm = SharedMemory(name=pred_name)
+    _shared['buffers'] = (dist_shm, pred_shm)
+    _shared['dist'] = np.ndarray((n, n), dtype=np.float64, buffer=dist_shm.buf)
+    _shared['pred'] = np.ndarray((n, n), dtype=np.int64, buffer=pred_shm.buf)
+
+
+def _run_tile(task: tuple[int, int, int, int, int, int]) -> None:
+    """Relaxes one tile of the shared matrices.
+
+    Args:
+        task (tuple): (row_start, row_stop, col_start, col_stop, k_start, k_stop) of the tile.
+    """
+    r0, r1, c0, c1, k0, k1 = task
+    _update_tile(_shared['dist'], _shared['pred'], slice(r0, r1), slice(c0, c1), slice(k0, k1))
+
+
+def floyd_parallel(adj_matrix, block_size=512, processes=None, no_edge=0):
+    """Computes all-pairs shortest paths with a blocked Floyd-Warshall spread over a process pool.
+
+    For every diagonal block K the algorithm runs three phases:
+    1. the diagonal tile (K, K) is relaxed in the main process,
+    2. the tiles in the row and the column of K are relaxed in parallel,
+    3. all remaining tiles are relaxed in parallel.
+    The tiles of one phase never write to the same cells and only read cells finished by the
+    previous phase. The matrices live in shared memory, so only the tile bounds are sent to the workers.
+
+    Args:
+        adj_matrix (list[list[int]]): Adjacency matrix representing the graph.
+            A 0 (except on diagonal) indicates no direct edge.
+        block_size (int): The tile size.
+        processes (int): The number of worker processes, 'os.cpu_count()' by default.
+        no_edge (float): The matrix value that marks a missing edge. Pass float('inf')
+            to keep 0-weight edges.
+
+    Returns:
+        tuple: A tuple (dist, pred) of NumPy arrays like 'floyd' in the 'blocked' mode.
+    """
+    init_dist, init_pred = _init_arrays(adj_matrix, no_edge)
+    n = len(init_dist)
+    if n == 0:
+        return init_dist, init_pred
+
+    dist_shm = SharedMemory(create=True, size=init_dist.nbytes)
+    pred_shm = SharedMemory(create=True, size=init_pred.nbytes)
+    try:
+        dist = np.ndarray(init_dist.shape, dtype=np.float64, buffer=dist_shm.buf)
+        pred = np.ndarray(init_pred.shape, dtype=np.int64, buffer=pred_shm.buf)
+        dist[:] = init_dist
+        pred[:] = init_pred
+        del init_dist, init_pred
+
+        bounds = [(start, min(start + block_size, n)) for start in range(0, n, block_size)]
+        with Pool(processes, initializer=_attach, initargs=(dist_shm.name, pred_shm.name, n)) as pool:
+            for k0, k1 in bounds:
+                _update_tile(dist, pred, slice(k0, k1), slice(k0, k1), slice(k0, k1))
+
+                panels = []
+                for b0, b1 in bounds:
+                    if b0 != k0:
+                        panels.append((k0, k1, b0, b1, k0, k1))
+                        panels.append((b0, b1, k0, k1, k0, k1))
+                pool.map(_run_tile, panels)
+
+                rest = [(r0, r1, c0, c1, k0, k1)
+                        for r0, r1 in bounds if r0 != k0
+                        for c0, c1 in bounds if c0 != k0]
+                pool.map(_run_tile, rest)
+
+        result = dist.copy(), pred.copy()
+        #  The views must be released before the shared memory can be closed
+        del dist, pred
+        return result
+    finally:
+        dist_shm.close()
+        dist_shm.unlink()
+        pred_shm.close()
+        pred_shm.unlink()
+
+
+def test_parallel_matches_blocked():
+    from .floyd_algorithm import floyd
+
+    rng = np.random.default_rng(4)
+    matrix = rng.integers(1, 50, size=(45, 45)) * (rng.random((45, 45)) < 0.1)
+    expected_dist, _ = floyd(matrix, mode='blocked', block_size=16)
+    dist, pred = floyd_parallel(matrix, block_size=16, processes=2)
+    assert np.array_equal(dist, expected_dist)
+    off_diagonal = ~np.eye(45, dtype=bool)
+    assert ((pred == -1) == np.isinf(dist))[off_diagonal].all()
+
+    zero_weights = np.where(matrix == 0, np.inf, matrix - 1)
+    expected_dist, _ = floyd(zero_weights, mode='blocked', block_size=16, no_edge=np.inf)
+    dist, _ = floyd_parallel(zero_weights, block_size=16, processes=2, no_edge=np.inf)
+    assert np.array_equal(dist, expected_dist) and (dist[off_diagonal] == 0).any()
+
+
+if __name__ == "__main__":
+    from time import perf_counter
+
+    from .floyd_algorithm import floyd
+
+    rng = np.random.default_rng(0)
+    size = 1024
+    matrix = rng.integers(1, 100, size=(size, size)) * (rng.random((size, size)) < 0.05)
+
+    begin = perf_counter()
+    expected, _ = floyd(matrix, mode='blocked')
+    print(f"blocked, 1 process: {perf_counter() - begin:.2f} s")
+
+    begin = perf_counter()
+    actual, _ = floyd_parallel(matrix, block_size=256)
+    print(f"parallel blocked:   {perf_counter() - begin:.2f} s")
+    print("Results match:", np.array_equal(expected, actual))
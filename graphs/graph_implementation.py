@@ -1,13 +1,20 @@
 from abc import ABC, abstractmethod
 
+from .disjoint_set import DisjointSet
+
 
 class GraphInterface(ABC):
     """Represents an abstract class that all graphs should inherit from."""
     @abstractmethod
     def __init__(self, num_vertices: int):
-        """Initializes a graph with finite given number of vertices."""
+        """Initializes a graph with finite given number of vertices.
+
+        Sets 'self.version', a counter increased by every 'add_edge', so caches such as
+        'ShortestPathCache' can tell that the graph has changed.
+        """
         super().__init__()
         self.graph = {i: [] for i in range(1, num_vertices + 1)}
+        self.version = 0
 
     @abstractmethod
     def add_edge(self, v1: int, v2: int) -> None:
@@ -62,8 +69,14 @@ class WeightedGraphInterface(GraphInterface):
 class Graph(GraphInterface):
     """Represents an undirected graph."""
     def __init__(self, num_vertices: int):
-        """Initializes an empty graph."""
+        """Initializes an empty graph.
+
+        Sets 'self.components', a disjoint set that is kept up to date by 'add_edge',
+        so connectivity queries do not need to traverse the graph. Vertex v is the
+        element v - 1 of the disjoint set, so 'components.count' is the number of components.
+        """
         super().__init__(num_vertices)
+        self.components = DisjointSet(num_vertices)
 
     def add_edge(self, v1: int, v2: int) -> None:
         """Adds an undirected edge between vertices v1 and v2.
@@ -74,8 +87,30 @@ class Graph(GraphInterface):
         """
         self.graph[v1].append(v2)
         self.graph[v2].append(v1)
+        self.components.union(v1 - 1, v2 - 1)
+        self.version += 1
         return
 
+    def is_connected(self, v1: int, v2: int) -> bool:
+        """Checks if there is a path between vertices v1 and v2.
+
+        Args:
+            v1 (int): The first vertex.
+            v2 (int): The second vertex.
+
+        Returns:
+            bool: True if v1 and v2 are in the same connected component, otherwise False.
+        """
+        return self.components.connected(v1 - 1, v2 - 1)
+
+    def component_size(self, v: int) -> int:
+        """Returns the number of vertices in the connected component of the given vertex v."""
+        return self.components.component_size(v - 1)
+
+    def component_count(self) -> int:
+        """Returns the number of connected components, isolated vertices included."""
+        return self.components.count
+
     def is_adjacent(self, v1: int, v2: int) -> bool:
         """Checks if vertices v1 and v2 are adjacent.
 
@@ -114,6 +149,7 @@ class DirectedGraph(GraphInterface):
             v2 (int): The second vertex.
         """
         self.graph[v1].append(v2)
+        self.version += 1
         return
 
     def is_adjacent(self, v1: int, v2: int) -> bool:
@@ -156,6 +192,7 @@ class WeightedGraph(WeightedGraphInterface):
         """
         self.graph[v1].append((v2, w))
         self.graph[v2].append((v1, w))
+        self.version += 1
         return
 
     def is_adjacent(self, v1: int, v2: int) -> bool:
@@ -183,6 +220,17 @@ class WeightedGraph(WeightedGraphInterface):
         return self.graph.get(v, [])
 
 
+def test_components_of_graph():
+    graph = Graph(5)
+    assert graph.component_count() == 5
+    graph.add_edge(1, 2)
+    graph.add_edge(2, 3)
+    graph.add_edge(5, 4)
+    assert graph.component_count() == graph.components.count == 2
+    assert graph.is_connected(1, 3) and not graph.is_connected(3, 4)
+    assert graph.component_size(1) == 3 and graph.component_size(5) == 2
+
+
 if __name__ == "__main__":
     graph = Graph(5)
 
@@ -203,6 +251,11 @@ if __name__ == "__main__":
     # Check non-existing vertex
     print("Adjacent vertices to 5:", graph.return_adjacent(5))  # []
 
+    # Check connectivity
+    print("Is 1 connected to 4?", graph.is_connected(1, 4))  # True
+    print("Is 1 connected to 5?", graph.is_connected(1, 5))  # False
+    print("Number of components:", graph.component_count())  # 2
+
     directed_graph = DirectedGraph(5)
 
     # Add directed edges
@@ -0,0 +1,188 @@
+import csv
+import mmap
+import struct
+from array import array
+from collections.abc import Iterator
+
+from .csr_graph import CSRGraph
+
+#  Header of the binary format: magic, format version, typecodes of offsets, targets and weights,
+#  number of vertices, number of stored edges. The arrays follow in native byte order.
+_MAGIC = b'CSRG'
+_VERSION = 1
+_HEADER = struct.Struct('<4sB3sqq')
+_ALIGN = 8
+
+
+def iter_edge_file(path: str, delimiter: str | None = None, default_weight: int = 1) -> Iterator[tuple]:
+    """Streams the edges of a CSV or TSV edge list one line at a time.
+
+    Every row holds 'vertex1, vertex2[, weight]'. Empty rows, rows starting with '#'
+    and a header row whose first field is not a number are skipped. The file is read
+    lazily, so the whole text is never held in memory.
+
+    Args:
+        path (str): The path to the edge list.
+        delimiter (str | None): The field separator, or 'None' for a tab in '.tsv'
+            files and a comma otherwise.
+        default_weight (int): The weight of rows without a weight column.
+
+    Yields:
+        tuple: The next (vertex1, vertex2, weight) edge, the weight is an int when possible and a float otherwise.
+
+    Raises:
+        ValueError: If a row has fewer than two fields or a field is not a number.
+    """
+    if delimiter is None:
+        delimiter = '\t' if str(path).endswith('.tsv') else ','
+
+    with open(path, newline='') as file:
+        for line_number, row in enumerate(csv.reader(file, delimiter=delimiter), start=1):
+            if not row or row[0].lstrip().startswith('#'):
+                continue
+            if len(row) < 2:
+                raise ValueError(f"{path}:{line_number}: expected at least two fields, got {row}.")
+            try:
+                vertex1, vertex2 = int(row[0]), int(row[1])
+            except ValueError:
+                if line_number == 1:
+                    continue  # A header row
+                raise ValueError(f"{path}:{line_number}: the vertices must be integers, got {row}.") from None
+
+            if len(row) < 3 or not row[2].strip():
+                weight = default_weight
+            else:
+                try:
+                    weight = int(row[2])
+                except ValueError:
+                    weight = float(row[2])
+            yield vertex1, vertex2, weight
+
+
+def load_edge_file(path: str, num_vertices: int | None = None, directed: bool = False,
+                   delimiter: str | None = None) -> CSRGraph:
+    """Loads a CSV or TSV edge list into a 'CSRGraph' without reading the whole file at once.
+
+    Args:
+        path (str): The path to the edge list, see 'iter_edge_file' for the format.
+        num_vertices (int | None): The number of vertices, or 'None' to take the largest vertex in the file.
+        directed (bool): If False, every edge is stored in both directions.
+        delimiter (str | None): The field separator, see 'iter_edge_file'.
+
+    Returns:
+        CSRGraph: The loaded graph.
+    """
+    return CSRGraph.from_edges(num_vertices, iter_edge_file(path, delimiter), directed=directed)
+
+
+def save_binary(graph, path: str) -> None:
+    """Writes a graph to the compact binary format read by 'load_binary'.
+
+    The file is a 32-byte header followed by the raw offsets, targets and weights
+    arrays of the CSR form, each one starting at a multiple of 8 bytes.
+
+    Args:
+        graph (CSRGraph | WeightedGraph | dict): The graph, anything else than a 'CSRGraph' is converted first.
+        path (str): The path of the file to write.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_weighted_graph(graph)
+
+    sections = [_as_array(graph.offsets), _as_array(graph.targets), _as_array(graph.weights)]
+    typecodes = ''.join(section.typecode for section in sections).encode()
+    with open(path, 'wb') as file:
+        header = _HEADER.pack(_MAGIC, _VERSION, typecodes, graph.num_vertices, len(graph.targets))
+        file.write(header.ljust(_padded(len(header)), b'\0'))
+        for section in sections:
+            section.tofile(file)
+            size = len(section) * section.itemsize
+            file.write(b'\0' * (_padded(size) - size))
+
+
+def load_binary(path: str) -> CSRGraph:
+    """Maps a graph written by 'save_binary' into memory without reading it.
+
+    The arrays of the returned graph are views into the memory-mapped file, so loading
+    takes constant time and the pages are only read by the operating system when a
+    vertex is visited. The file must not be changed while the graph is in use.
+
+    Args:
+        path (str): The path of the file to load.
+
+    Returns:
+        CSRGraph: The graph, backed by the file.
+
+    Raises:
+        ValueError: If the file is not in the binary graph format.
+    """
+    with open(path, 'rb') as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(buffer) < _HEADER.size:
+        raise ValueError(f"{path} is not a binary graph file.")
+    magic, version, typecodes, num_vertices, num_edges = _HEADER.unpack_from(buffer)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError(f"{path} is not a binary graph file of version {_VERSION}.")
+
+    view = memoryview(buffer)
+    position = _padded(_HEADER.size)
+    sections = []
+    for typecode, length in zip(typecodes.decode(), (num_vertices + 2, num_edges, num_edges)):
+        size = length * array(typecode).itemsize
+        if position + size > len(buffer):
+            raise ValueError(f"{path} is truncated.")
+        sections.append(view[position:position + size].cast(typecode))
+        position += _padded(size)
+
+    return CSRGraph(*sections)
+
+
+def _as_array(values) -> array:
+    """Returns values as an 'array', copying only if it is a view of another buffer."""
+    if isinstance(values, array):
+        return values
+    return array(values.format, values)
+
+
+def _padded(size: int) -> int:
+    """Rounds size up to the next multiple of the section alignment."""
+    return -(-size // _ALIGN) * _ALIGN
+
+
+def test_edge_file_and_binary_round_trip(tmp_path):
+    import pytest
+
+    edge_file = tmp_path / "roads.tsv"
+    edge_file.write_text("source\ttarget\tweight\n1\t2\t15\n2\t3\n# closed road\n3\t4\t7.5\n")
+    graph = load_edge_file(str(edge_file))
+    assert graph.num_vertices == 4 and graph.num_edges == 6
+    assert sorted(graph[2]) == [(1, 15.0), (3, 1.0)]
+
+    binary_file = tmp_path / "roads.csrg"
+    save_binary(graph, str(binary_file))
+    mapped = load_binary(str(binary_file))
+    assert all(sorted(mapped[v]) == sorted(graph[v]) for v in range(1, 5))
+
+    (tmp_path / "broken.csrg").write_bytes(binary_file.read_bytes()[:40])
+    with pytest.raises(ValueError):
+        load_binary(str(tmp_path / "broken.csrg"))
+    del mapped
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        edge_file = os.path.join(directory, "roads.csv")
+        with open(edge_file, "w") as file:
+            file.write("source,target,weight\n1,2,15\n2,3,13\n1,3,40\n# closed road\n3,4,7.5\n")
+
+        graph = load_edge_file(edge_file)
+        print(graph[3])  # [(2, 13.0), (1, 40.0), (4, 7.5)]
+
+        binary_file = os.path.join(directory, "roads.csrg")
+        save_binary(graph, binary_file)
+        mapped = load_binary(binary_file)
+        print(mapped[3], mapped.num_edges)  # [(2, 13.0), (1, 40.0), (4, 7.5)] 8
+        del graph, mapped
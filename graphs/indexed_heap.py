@@ -0,0 +1,192 @@
+from array import array
+
+
+class IndexedMinHeap:
+    """Represents an array-backed binary min-heap over the integer items 0..capacity-1.
+
+    Every item can be in the heap at most once, and its key can be lowered in place with
+    'decrease_key'. The heap is stored in three flat arrays instead of a list of tuples:
+    - keys: the current key of every item,
+    - heap: the items in heap order,
+    - pos: the position of every item in 'heap', or -1 if the item is not in the heap.
+    """
+    def __init__(self, capacity: int) -> None:
+        """Initializes an empty heap for the items 0..capacity-1.
+
+        Args:
+            capacity (int): The number of distinct items the heap can hold.
+        """
+        self.keys = array('d', [float('inf')]) * capacity
+        self.heap = array('l', [0]) * capacity
+        self.pos = array('l', [-1]) * capacity
+        self.size = 0
+
+    def __len__(self) -> int:
+        """Returns the number of items in the heap."""
+        return self.size
+
+    def __contains__(self, item: int) -> bool:
+        """Checks if the given item is in the heap.
+
+        Args:
+            item (int): The item to check.
+
+        Returns:
+            bool: True if the item is in the heap, False otherwise.
+        """
+        return self.pos[item] != -1
+
+    def is_empty(self) -> bool:
+        """Checks if the heap is empty.
+
+        Returns:
+            bool: True if the heap is empty, False otherwise.
+        """
+        return self.size == 0
+
+    def get_key(self, item: int) -> float:
+        """Returns the last key assigned to the given item.
+
+        Args:
+            item (int): The given item.
+
+        Returns:
+            float: The key of the item.
+        """
+        return self.keys[item]
+
+    def insert(self, item: int, key: float) -> None:
+        """Inserts a new item with the given key.
+
+        Args:
+            item (int): The item to insert.
+            key (float): The key of the item.
+
+        Raises:
+            KeyError: If the item is already in the heap.
+        """
+        if self.pos[item] != -1:
+            raise KeyError(f"Item {item} is already in the heap.")
+        self.keys[item] = key
+        self.heap[self.size] = item
+        self.pos[item] = self.size
+        self.size += 1
+        self._sift_up(self.size - 1)
+
+    def decrease_key(self, item: int, key: float) -> None:
+        """Lowers the key of an item that is already in the heap.
+
+        Args:
+            item (int): The item whose key is lowered.
+            key (float): The new key, not greater than the current one.
+
+        Raises:
+            KeyError: If the item is not in the heap.
+            ValueError: If the new key is greater than the current key.
+        """
+        if self.pos[item] == -1:
+            raise KeyError(f"Item {item} is not in the heap.")
+        if key > self.keys[item]:
+            raise ValueError(f"New key {key} is greater than the current key {self.keys[item]}.")
+        self.keys[item] = key
+        self._sift_up(self.pos[item])
+
+    def peek(self) -> int:
+        """Returns the item with the smallest key without removing it.
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if self.size == 0:
+            raise IndexError("Peek from an empty heap.")
+        return self.heap[0]
+
+    def pop(self) -> int:
+        """Removes and returns the item with the smallest key.
+
+        The key of the popped item stays available through 'get_key'.
+
+        Raises:
+            IndexError: If the heap is empty.
+        """
+        if self.size == 0:
+            raise IndexError("Pop from an empty heap.")
+        top = self.heap[0]
+        self.size -= 1
+        last = self.heap[self.size]
+        self.pos[top] = -1
+        if self.size:
+            self.heap[0] = last
+            self.pos[last] = 0
+            self._sift_down(0)
+        return top
+
+    def _sift_up(self, i: int) -> None:
+        """Moves the item at position i up until its parent has a smaller or equal key."""
+        heap, pos, keys = self.heap, self.pos, self.keys
+        item = heap[i]
+        key = keys[item]
+        while i > 0:
+            parent = (i - 1) >> 1
+            parent_item = heap[parent]
+            if keys[parent_item] <= key:
+                break
+            heap[i] = parent_item
+            pos[parent_item] = i
+            i = parent
+        heap[i] = item
+        pos[item] = i
+
+    def _sift_down(self, i: int) -> None:
+        """Moves the item at position i down until both children have greater or equal keys."""
+        heap, pos, keys, size = self.heap, self.pos, self.keys, self.size
+        item = heap[i]
+        key = keys[item]
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            right = child + 1
+            if right < size and keys[heap[right]] < keys[heap[child]]:
+                child = right
+            child_item = heap[child]
+            if key <= keys[child_item]:
+                break
+            heap[i] = child_item
+            pos[child_item] = i
+            i = child
+        heap[i] = item
+        pos[item] = i
+
+
+def test_heap_pops_in_key_order():
+    import heapq
+    from random import Random
+
+    import pytest
+
+    rng = Random(6)
+    heap = IndexedMinHeap(50)
+    keys = {}
+    for item in rng.sample(range(50), 30):
+        keys[item] = rng.randint(0, 1000)
+        heap.insert(item, keys[item])
+    for item in rng.sample(list(keys), 10):
+        keys[item] -= rng.randint(0, 500)
+        heap.decrease_key(item, keys[item])
+
+    assert len(heap) == 30 and heap.get_key(heap.peek()) == min(keys.values())
+    popped = []
+    while not heap.is_empty():
+        item = heap.pop()
+        assert item not in heap
+        popped.append(keys[item])
+    assert popped == heapq.nsmallest(30, keys.values())
+
+    with pytest.raises(IndexError):
+        heap.pop()
+    heap.insert(3, 5)
+    with pytest.raises(KeyError):
+        heap.insert(3, 1)
+    with pytest.raises(ValueError):
+        heap.decrease_key(3, 9)
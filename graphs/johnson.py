@@ -0,0 +1,205 @@
+import json
+from math import isinf, log2
+from multiprocessing import Pool
+
+from .adjacency import as_adjacency
+from .bellman_ford import NegativeCycleError, bellman_ford
+from .dijkstra_algorithm import shortest_path_tree
+from .floyd_algorithm import floyd
+
+try:
+    import numpy as np
+except ImportError:  # '_floyd_rows' falls back to the pure Python mode
+    np = None
+
+#  The reweighted graph and the potentials inside a worker process
+_shared = {}
+
+
+def _attach(reweighted: dict, potential: dict, vertices: list) -> None:
+    """Pool initializer: stores the reweighted graph once per worker instead of once per task."""
+    _shared['graph'] = reweighted
+    _shared['potential'] = potential
+    _shared['vertices'] = vertices
+
+
+def _source_row(source) -> tuple:
+    """Runs Dijkstra from one source on the reweighted graph and restores the real distances.
+
+    Returns:
+        tuple: (source, dist_row, pred_row) aligned with the vertex order of the graph.
+    """
+    potential = _shared['potential']
+    dist, prev = shortest_path_tree(_shared['graph'], source)
+    shift = potential[source]
+    dist_row = [dist[v] - shift + potential[v] for v in _shared['vertices']]
+    pred_row = [prev[v] for v in _shared['vertices']]
+    return source, dist_row, pred_row
+
+
+def johnson(graph, processes=None):
+    """Computes all-pairs shortest paths with Johnson's algorithm, one source row at a time.
+
+    Negative edges are removed by reweighting w'(u, v) = w(u, v) + h(u) - h(v), where h are the
+    Bellman-Ford potentials from a virtual source. Then Dijkstra runs once per source, in a process
+    pool if processes is given. Only one row at a time is kept in memory by the caller.
+
+    Args:
+        graph (WeightedGraph | CSRGraph | dict): The weighted graph.
+        processes (int | None): The number of worker processes, or 'None' to run in this process.
+
+    Yields:
+        tuple: (source, dist_row, pred_row), where the rows are aligned with the vertex order
+        of the graph, 'inf' marks an unreachable vertex and 'None' a missing predecessor.
+
+    Raises:
+        NegativeCycleError: If the graph contains a negative cycle.
+    """
+    adj_list = as_adjacency(graph)
+    vertices = list(adj_list)
+
+    if any(weight < 0 for u in adj_list for _, weight in adj_list[u]):
+        potential, _ = bellman_ford(adj_list)
+        reweighted = {u: [(v, weight + potential[u] - potential[v]) for v, weight in adj_list[u]]
+                      for u in adj_list}
+    else:
+        potential = dict.fromkeys(vertices, 0)
+        reweighted = adj_list
+
+    if processes is None:
+        _attach(reweighted, potential, vertices)
+        yield from map(_source_row, vertices)
+        return
+
+    with Pool(processes, initializer=_attach, initargs=(reweighted, potential, vertices)) as pool:
+        yield from pool.imap(_source_row, vertices, chunksize=max(1, len(vertices) // (4 * processes)))
+
+
+def _floyd_rows(adj_list):
+    """Runs 'floyd' on the adjacency matrix of the graph and yields its rows like 'johnson'.
+
+    The NumPy mode is used when NumPy is installed. Integer weights give integer distances,
+    like the rows of 'johnson'.
+
+    Raises:
+        NegativeCycleError: If the graph contains a negative cycle, like 'johnson'.
+    """
+    vertices = list(adj_list)
+    index = {v: i for i, v in enumerate(vertices)}
+    matrix = [[float('inf')] * len(vertices) for _ in vertices]
+    for i, row in enumerate(matrix):
+        row[i] = 0
+    integral = True
+    for u in adj_list:
+        row = matrix[index[u]]
+        for v, weight in adj_list[u]:
+            row[index[v]] = min(row[index[v]], weight)
+            integral = integral and isinstance(weight, int)
+
+    dist, pred = floyd(matrix, mode='python' if np is None else 'numpy', no_edge=float('inf'))
+    for i in range(len(vertices)):
+        if dist[i][i] < 0:
+            raise NegativeCycleError(_pred_cycle(pred, i, vertices))
+
+    for i, source in enumerate(vertices):
+        dist_row, pred_row = dist[i], pred[i]
+        if np is not None:
+            dist_row, pred_row = dist_row.tolist(), pred_row.tolist()
+        if integral:
+            dist_row = [d if isinf(d) else int(d) for d in dist_row]
+        yield source, dist_row, [None if p is None or p < 0 else vertices[p] for p in pred_row]
+
+
+def _pred_cycle(pred, i: int, vertices: list) -> list:
+    """Follows the predecessors of the row i back from i, which lies on a negative cycle.
+
+    Returns:
+        list: The vertices of the cycle in edge order, i repeated at the end,
+        or an empty list if the predecessors do not lead back to i.
+    """
+    cycle = [i]
+    v = pred[i][i]
+    while v is not None and v >= 0 and v != i and len(cycle) <= len(vertices):
+        cycle.append(v)
+        v = pred[i][v]
+    if v != i:
+        return []
+    cycle.append(i)
+    cycle.reverse()
+    return [vertices[v] for v in cycle]
+
+
+def all_pairs_shortest_paths(graph, method='auto', processes=None):
+    """Computes all-pairs shortest paths with the algorithm that suits the graph density.
+
+    Johnson's algorithm costs O(V E log V) and Floyd-Warshall O(V^3), so with 'auto'
+    Johnson is used while E log V < V^2, which covers every sparse graph.
+
+    Args:
+        graph (WeightedGraph | CSRGraph | dict): The weighted graph.
+        method (str): 'auto', 'johnson' or 'floyd'.
+        processes (int | None): Worker processes for Johnson's per-source Dijkstra runs.
+
+    Yields:
+        tuple: (source, dist_row, pred_row) as 'johnson' yields them.
+
+    Raises:
+        ValueError: If the method is unknown.
+    """
+    adj_list = as_adjacency(graph)
+    if method == 'auto':
+        num_vertices = len(adj_list)
+        num_edges = sum(len(adj_list[u]) for u in adj_list)
+        method = 'johnson' if num_edges * log2(num_vertices + 1) < num_vertices ** 2 else 'floyd'
+
+    if method == 'johnson':
+        yield from johnson(adj_list, processes)
+    elif method == 'floyd':
+        yield from _floyd_rows(adj_list)
+    else:
+        raise ValueError(f"Unknown method {method!r}, expected 'auto', 'johnson' or 'floyd'.")
+
+
+def write_all_pairs(graph, path, method='auto', processes=None) -> None:
+    """Streams all-pairs shortest paths to a file as newline-delimited JSON, one source per line.
+
+    Every line is {"source": s, "dist": [...], "pred": [...]} with the rows aligned with
+    the vertex order of the graph, so the full matrices are never held in memory.
+    Unreachable distances are written as 'null', since JSON has no infinity.
+
+    Args:
+        graph (WeightedGraph | CSRGraph | dict): The weighted graph.
+        path (str): The output file.
+        method (str): 'auto', 'johnson' or 'floyd'.
+        processes (int | None): Worker processes for Johnson's per-source Dijkstra runs.
+    """
+    with open(path, 'w') as file:
+        for source, dist_row, pred_row in all_pairs_shortest_paths(graph, method, processes):
+            file.write(_all_pairs_line(source, dist_row, pred_row))
+
+
+def _all_pairs_line(source, dist_row, pred_row) -> str:
+    """Formats one source of the all-pairs result as a line of strict JSON."""
+    dist_row = [None if isinf(d) else d for d in dist_row]
+    return json.dumps({"source": source, "dist": dist_row, "pred": pred_row}, allow_nan=False) + "\n"
+
+
+def test_write_all_pairs_is_strict_json(tmp_path):
+    graph = {1: [(2, 3)], 2: [(3, -1)], 3: [], 4: [(1, 2)]}
+    expected = {1: [0, 3, 2, None], 2: [None, 0, -1, None], 3: [None, None, 0, None], 4: [2, 5, 4, 0]}
+    for method in ('johnson', 'floyd'):
+        path = tmp_path / f"{method}.ndjson"
+        write_all_pairs(graph, path, method)
+        rows = [json.loads(line, parse_constant=lambda name: 1 / 0) for line in path.read_text().splitlines()]
+        assert {row["source"]: row["dist"] for row in rows} == expected
+
+
+def test_floyd_method_reports_negative_cycles():
+    import pytest
+
+    graph = {1: [(2, 1)], 2: [(1, -3)], 3: [(1, 1)]}
+    for method in ('johnson', 'floyd'):
+        with pytest.raises(NegativeCycleError) as error:
+            list(all_pairs_shortest_paths(graph, method))
+        if method == 'floyd':
+            assert error.value.cycle in ([1, 2, 1], [2, 1, 2])
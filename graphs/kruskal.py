@@ -1,72 +1,94 @@
-def kruskal(adj_list) -> None:
-    """Computes the total weight of the Minimum Spanning Tree (MST) using Kruskal's algorithm.
+from .adjacency import as_adjacency
+from .disjoint_set import DisjointSet
 
-    This function implements Kruskal's algorithm for a given undirected, weighted graph
-    represented as an adjacency list. It works by:
-    1. Extracting all edges from the graph.
+
+def kruskal(adj_list, on_step=None) -> tuple[list[tuple], int]:
+    """Computes the Minimum Spanning Tree (MST) using Kruskal's algorithm.
+
+    This function implements Kruskal's algorithm for a given undirected, weighted graph.
+    It works by:
+    1. Extracting every undirected edge once.
     2. Sorting them in ascending order of weight.
     3. Iteratively selecting the smallest edge that connects two disjoint components
-        (using a simple Union-Find mechanism).
-    4. Accumulating the total weight of the MST without forming cycles.
+        (using 'DisjointSet').
+    4. Accumulating the MST edges and their total weight without forming cycles.
+    For a disconnected graph the result is a minimum spanning forest.
 
     Args:
-        adj_list (dict): Adjacency list where each node maps to its neighbors and edge weights.
+        adj_list (dict | WeightedGraph | CSRGraph): The undirected graph in any shape
+            accepted by 'as_adjacency', e.g. {node: {neighbour: weight}}.
+        on_step (Callable | None): Optional hook called as on_step(u, v, weight, added)
+            for every processed edge, e.g. to trace the algorithm.
 
     Returns:
-        None: The function prints the step-by-step process and the total weight of the MST.
+        tuple[list[tuple], int]: The MST edges as (u, v, weight) and the total weight of the MST.
     """
-    total = 0
-    edges = []
-
-    #  Collect all edges, avoiding duplicates
-    for u in adj_list:
-        for v in adj_list[u]:
-            if (v, u, adj_list[u][v]) not in edges:
-                edges.append((u, v, adj_list[u][v]))
+    adj_list = as_adjacency(adj_list)
+    order = {node: i for i, node in enumerate(adj_list)}
 
+    edges = list(_undirected_edges(adj_list, order).values())
     edges.sort(key=lambda x: x[2])
 
-    print("Sorted edges:")
-    for e in edges:
-        print(f"  {e}")
-    print()
-
-    parent = {node: node for node in adj_list}
-    print(f"Initial parent mapping: {parent}")
-    print()
-
+    components = DisjointSet(len(order))
+    mst = []
+    total = 0
     for u, v, weight in edges:
-        root_u = u
-        while parent[root_u] != root_u:
-            root_u = parent[root_u]
+        added = components.union(order[u], order[v])
+        if added:
+            mst.append((u, v, weight))
+            total += weight
 
-        root_v = v
-        while parent[root_v] != root_v:
-            root_v = parent[root_v]
+        if on_step:
+            on_step(u, v, weight, added)
 
-        print(f"Processing edge ({u}, {v}) with weight {weight}")
-        print(f"  Root of {u}: {root_u}, Root of {v}: {root_v}")
+        if len(mst) == len(adj_list) - 1:
+            break
 
-        if root_u != root_v:
-            parent[root_u] = root_v  # Union
-            total += weight
-            print(f"   Edge added. Updated parent: {root_u} → {root_v}")
-            print(f"   Current MST total weight: {total}")
-        else:
-            print(f"   Edge skipped to avoid cycle.")
+    return mst, total
 
-        print(f"  Current parent mapping: {parent}\n")
 
-    print(f"Total spanning tree weight is {total}")
+def _undirected_edges(adj_list, order: dict) -> dict[tuple[int, int], tuple]:
+    """Collects every undirected edge once, whether it is listed in one or both directions.
 
+    The edges are keyed by the sorted positions of their ends in 'order'. Of parallel edges
+    only the cheapest one can be in an MST, so it is the one kept. Self-loops are skipped.
 
-graph = {
-    'A': {'B': 4, 'C': 4},
-    'B': {'A': 4, 'C': 2},
-    'C': {'A': 4, 'B': 2, 'D': 3, 'E': 1, 'F': 6},
-    'D': {'C': 3, 'F': 2},
-    'E': {'C': 1, 'F': 3},
-    'F': {'C': 6, 'D': 2, 'E': 3},
-}
+    Returns:
+        dict[tuple[int, int], tuple]: The (u, v, weight) edge of every pair of adjacent vertices.
+    """
+    edges = {}
+    for u in adj_list:
+        iu = order[u]
+        for v, weight in adj_list[u]:
+            iv = order[v]
+            if iu == iv:
+                continue
+            key = (iu, iv) if iu < iv else (iv, iu)
+            known = edges.get(key)
+            if known is None or weight < known[2]:
+                edges[key] = (u, v, weight)
+    return edges
+
+
+def test_edges_listed_in_one_direction():
+    assert kruskal({'A': {}, 'B': {'A': 1}, 'C': {'B': 2}}) == ([('B', 'A', 1), ('C', 'B', 2)], 3)
+    assert kruskal({1: [(2, 5), (2, 1)], 2: [(1, 5), (3, 2)], 3: []}) == ([(1, 2, 1), (2, 3, 2)], 3)
+
+
+if __name__ == "__main__":
+    graph = {
+        'A': {'B': 4, 'C': 4},
+        'B': {'A': 4, 'C': 2},
+        'C': {'A': 4, 'B': 2, 'D': 3, 'E': 1, 'F': 6},
+        'D': {'C': 3, 'F': 2},
+        'E': {'C': 1, 'F': 3},
+        'F': {'C': 6, 'D': 2, 'E': 3},
+    }
+
+    def print_step(u, v, weight, added):
+        print(f"Processing edge ({u}, {v}) with weight {weight}")
+        print(f"   Edge {'added' if added else 'skipped to avoid cycle'}.")
 
-kruskal(graph)
+    mst, total = kruskal(graph, on_step=print_step)
+    print(f"MST edges: {mst}")
+    print(f"Total spanning tree weight is {total}")
@@ -0,0 +1,137 @@
+from collections import OrderedDict
+
+from .dijkstra_algorithm import build_path, shortest_path_tree
+
+
+class ShortestPathCache:
+    """Represents an LRU cache of shortest paths in front of 'shortest_path_tree'.
+
+    The answers are keyed by (graph version, source, target). The graphs of 'weighted_graph.py'
+    and 'graph_implementation.py' increase their 'version' on every edge change, so an answer
+    computed before a change is never returned after it, and the outdated entries are dropped
+    at the next lookup. Graphs without a 'version' attribute (plain dictionaries, 'CSRGraph')
+    are treated as never changing, a changed dictionary needs an explicit 'clear'.
+
+    With cache_trees, the whole shortest-path tree of a source is kept as well, so the
+    next query from the same source to any target is answered without a search.
+    """
+    def __init__(self, graph, max_paths: int = 10_000, cache_trees: bool = False, max_trees: int = 16) -> None:
+        """Initializes an empty cache for the given graph.
+
+        Args:
+            graph (WeightedGraph | CSRGraph | dict): The weighted graph to query.
+            max_paths (int): The maximum number of cached (source, target) answers.
+            cache_trees (bool): If True, whole single-source trees are cached too.
+            max_trees (int): The maximum number of cached trees, each one takes O(V) memory.
+        """
+        self.graph = graph
+        self.max_paths = max_paths
+        self.cache_trees = cache_trees
+        self.max_trees = max_trees
+        self.paths: OrderedDict = OrderedDict()
+        self.trees: OrderedDict = OrderedDict()
+        self.version = getattr(graph, 'version', 0)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Returns the number of cached (source, target) answers."""
+        return len(self.paths)
+
+    def query(self, source, target) -> tuple[float, list]:
+        """Returns the shortest distance and path from source to target.
+
+        Args:
+            source (int): The starting vertex.
+            target (int): The target vertex.
+
+        Returns:
+            tuple[float, list]: The shortest distance and the path, or ('inf', []) if target is unreachable.
+        """
+        self._check_version()
+        key = (self.version, source, target)
+        answer = self.paths.get(key)
+        if answer is not None:
+            self.paths.move_to_end(key)
+            self.hits += 1
+            return answer
+
+        tree = self.trees.get((self.version, source))
+        if tree is not None:
+            self.trees.move_to_end((self.version, source))
+            self.hits += 1
+        else:
+            self.misses += 1
+            if self.cache_trees:
+                tree = shortest_path_tree(self.graph, source)
+                self._store(self.trees, (self.version, source), tree, self.max_trees)
+            else:
+                tree = shortest_path_tree(self.graph, source, target=target)
+
+        dist, prev = tree
+        answer = dist[target], build_path(dist, prev, target)
+        self._store(self.paths, key, answer, self.max_paths)
+        return answer
+
+    def distance(self, source, target) -> float:
+        """Returns the shortest distance from source to target, 'inf' if target is unreachable."""
+        return self.query(source, target)[0]
+
+    def clear(self) -> None:
+        """Removes every cached answer and tree."""
+        self.paths.clear()
+        self.trees.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        """Returns the hit and miss counters and the hit rate."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "paths": len(self.paths),
+            "trees": len(self.trees),
+        }
+
+    def _check_version(self) -> None:
+        """Drops every cached entry if the graph has changed since they were computed."""
+        version = getattr(self.graph, 'version', 0)
+        if version != self.version:
+            self.clear()
+            self.version = version
+
+    @staticmethod
+    def _store(cache: OrderedDict, key, value, limit: int) -> None:
+        """Adds an entry and evicts the least recently used ones above the limit."""
+        cache[key] = value
+        while len(cache) > limit:
+            cache.popitem(last=False)
+
+
+def test_cache_sees_edge_changes():
+    from .graph_implementation import WeightedGraph as ListWeightedGraph
+    from .weighted_graph import WeightedGraph
+
+    for graph in (WeightedGraph(3), ListWeightedGraph(3)):
+        graph.add_edge(1, 2, 10)
+        graph.add_edge(2, 3, 10)
+        cache = ShortestPathCache(graph)
+        assert cache.query(1, 3) == (20, [1, 2, 3])
+        graph.add_edge(1, 3, 1)
+        assert cache.query(1, 3) == (1, [1, 3])
+
+
+if __name__ == "__main__":
+    from .weighted_graph import WeightedGraph
+
+    graph = WeightedGraph(num_vertices=5)
+    graph.add_edge(1, 2, 15)
+    graph.add_edge(2, 3, 13)
+    graph.add_edge(1, 3, 40)
+
+    cache = ShortestPathCache(graph, cache_trees=True)
+    print(cache.query(1, 3))  # (28, [1, 2, 3]), miss
+    print(cache.query(1, 2))  # (15, [1, 2]), hit from the cached tree
+    graph.add_edge(1, 3, 10)
+    print(cache.query(1, 3))  # (10, [1, 3]), miss after the graph has changed
+    print(cache.stats())
@@ -0,0 +1,159 @@
+import heapq
+
+from .adjacency import as_adjacency
+
+
+def _walk_back(prev: dict, vertex) -> list:
+    """Follows the predecessor links from the vertex and returns the visited vertices, vertex first."""
+    path = []
+    while vertex is not None:
+        path.append(vertex)
+        vertex = prev[vertex]
+    return path
+
+
+def bidirectional_dijkstra(graph, start, end, reverse=None) -> tuple[float, list]:
+    """Finds the shortest path between two vertices by searching from both ends at once.
+
+    One Dijkstra search grows from start and another one grows backwards from end. Each step
+    expands the side with the smaller queue head. The search stops once the two queue heads
+    together are not shorter than the best path found through a vertex reached by both sides.
+    Each search covers roughly a ball of half the radius, so far fewer vertices are settled.
+
+    Args:
+        graph (WeightedGraph | CSRGraph | dict): The weighted graph.
+        start (int): The starting vertex.
+        end (int): The target vertex.
+        reverse (WeightedGraph | CSRGraph | dict | None): The graph with every edge reversed,
+            used by the backward search. 'None' means the graph is undirected.
+
+    Returns:
+        tuple[float, list]: The shortest distance and the path from start to end,
+        or ('inf', []) if end is unreachable.
+    """
+    if start == end:
+        return 0, [start]
+
+    adj_lists = (as_adjacency(graph), as_adjacency(reverse if reverse is not None else graph))
+    dist = ({start: 0}, {end: 0})
+    prev = ({start: None}, {end: None})
+    queues = ([(0, start)], [(0, end)])
+    best = float('inf')
+    meeting = None
+
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        curr_dist, u = heapq.heappop(queues[side])
+        if curr_dist > dist[side][u]:
+            continue
+
+        own, other = dist[side], dist[1 - side]
+        for v, weight in adj_lists[side][u]:
+            new_dist = curr_dist + weight
+            if new_dist < own.get(v, float('inf')):
+                own[v] = new_dist
+                prev[side][v] = u
+                heapq.heappush(queues[side], (new_dist, v))
+            if v in other and new_dist + other[v] < best:
+                best = new_dist + other[v]
+                meeting = v
+
+    if meeting is None:
+        return float('inf'), []
+
+    path = _walk_back(prev[0], meeting)
+    path.reverse()
+    path.extend(_walk_back(prev[1], prev[1][meeting]))
+    return best, path
+
+
+def astar(graph, start, end, heuristic) -> tuple[float, list]:
+    """Finds the shortest path between two vertices using the A* search.
+
+    A* is Dijkstra's algorithm with the queue ordered by dist(v) + heuristic(v), so vertices that
+    lead towards end are settled first. For a road graph the straight-line distance to end
+    is a typical heuristic. The result is exact as long as the heuristic never overestimates
+    the remaining distance, and 'lambda v: 0' turns A* back into Dijkstra's algorithm.
+
+    Args:
+        graph (WeightedGraph | CSRGraph | dict): The weighted graph.
+        start (int): The starting vertex.
+        end (int): The target vertex.
+        heuristic (Callable): heuristic(v) returns a lower bound of the distance from v to end.
+
+    Returns:
+        tuple[float, list]: The shortest distance and the path from start to end,
+        or ('inf', []) if end is unreachable.
+    """
+    adj_list = as_adjacency(graph)
+    dist = {start: 0}
+    prev = {start: None}
+    pq = [(heuristic(start), 0, start)]
+
+    while pq:
+        _, curr_dist, u = heapq.heappop(pq)
+        if curr_dist > dist[u]:
+            continue
+        if u == end:
+            path = _walk_back(prev, end)
+            path.reverse()
+            return curr_dist, path
+
+        for v, weight in adj_list[u]:
+            new_dist = curr_dist + weight
+            if new_dist < dist.get(v, float('inf')):
+                dist[v] = new_dist
+                prev[v] = u
+                heapq.heappush(pq, (new_dist + heuristic(v), new_dist, v))
+
+    return float('inf'), []
+
+
+def test_point_to_point_matches_dijkstra():
+    from random import Random
+
+    from .dijkstra_algorithm import shortest_path_tree
+
+    rng = Random(1)
+    graph = {v: [] for v in range(1, 81)}
+    for _ in range(200):
+        u, v, w = rng.randint(1, 80), rng.randint(1, 80), rng.randint(1, 9)
+        graph[u].append((v, w))
+    reverse = {v: [] for v in graph}
+    for u in graph:
+        for v, w in graph[u]:
+            reverse[v].append((u, w))
+
+    def length(path):
+        return sum(min(w for x, w in graph[u] if x == v) for u, v in zip(path, path[1:]))
+
+    for start in (1, 17, 42):
+        dist, _ = shortest_path_tree(graph, start)
+        for end in graph:
+            for found, path in (bidirectional_dijkstra(graph, start, end, reverse),
+                                astar(graph, start, end, lambda v: 0)):
+                assert found == dist[end]
+                if path:
+                    assert (path[0], path[-1]) == (start, end) and length(path) == found
+                else:
+                    assert found == float('inf')
+
+
+if __name__ == "__main__":
+    from math import dist as euclidean
+
+    #  Vertices of a 5 x 5 grid, the edge weight is the distance between the points
+    points = {1 + x + 5 * y: (x, y) for x in range(5) for y in range(5)}
+    grid = {v: [] for v in points}
+    for v, (x, y) in points.items():
+        for dx, dy in ((1, 0), (0, 1), (1, 1)):
+            if x + dx < 5 and y + dy < 5:
+                u = 1 + x + dx + 5 * (y + dy)
+                grid[v].append((u, euclidean(points[v], points[u])))
+                grid[u].append((v, euclidean(points[v], points[u])))
+
+    print("Bidirectional:", bidirectional_dijkstra(grid, 1, 25))
+    print("A*:", astar(grid, 1, 25, lambda v: euclidean(points[v], points[25])))
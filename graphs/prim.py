@@ -0,0 +1,262 @@
+from array import array
+from multiprocessing import Pool
+
+from .adjacency import as_adjacency
+from .disjoint_set import DisjointSet
+from .indexed_heap import IndexedMinHeap
+from .kruskal import _undirected_edges
+
+#  The edge arrays of 'boruvka' inside a worker process
+_shared = {}
+
+
+def prim(adj_list, start=None) -> tuple[list[tuple], int]:
+    """Computes the Minimum Spanning Tree (MST) using Prim's algorithm with an indexed heap.
+
+    The tree grows from the start vertex. The heap holds every vertex outside the tree keyed by
+    the lightest edge that connects it to the tree, and that key is lowered in place with
+    'decrease_key', so the algorithm runs in O(E log V) without sorting all edges up front.
+    For a disconnected graph the tree is regrown from every unvisited vertex, giving a forest.
+    An edge listed in only one direction is used in both, like in 'kruskal'.
+
+    Args:
+        adj_list (dict | WeightedGraph | CSRGraph): The undirected graph in any shape
+            accepted by 'as_adjacency'.
+        start (Any): The vertex to grow the tree from, the first vertex by default.
+
+    Returns:
+        tuple[list[tuple], int]: The MST edges as (u, v, weight) and the total weight, like 'kruskal'.
+    """
+    adj_list = as_adjacency(adj_list)
+    vertices = list(adj_list)
+    if start is not None:
+        vertices.remove(start)
+        vertices.insert(0, start)
+    index = {vertex: i for i, vertex in enumerate(vertices)}
+    neighbours = [[] for _ in vertices]
+    for (i, j), (_, _, weight) in _undirected_edges(adj_list, index).items():
+        neighbours[i].append((j, weight))
+        neighbours[j].append((i, weight))
+
+    in_tree = bytearray(len(vertices))
+    parent = [None] * len(vertices)
+    parent_weight = [None] * len(vertices)
+    pq = IndexedMinHeap(len(vertices))
+    mst = []
+    total = 0
+
+    for root in range(len(vertices)):
+        if in_tree[root]:
+            continue
+        pq.insert(root, 0)
+
+        while pq.size:
+            i = pq.pop()
+            in_tree[i] = 1
+            u = vertices[i]
+            if parent[i] is not None:
+                mst.append((vertices[parent[i]], u, parent_weight[i]))
+                total += parent_weight[i]
+
+            for j, weight in neighbours[i]:
+                if in_tree[j]:
+                    continue
+                if j not in pq:
+                    pq.insert(j, weight)
+                elif weight < pq.get_key(j):
+                    pq.decrease_key(j, weight)
+                else:
+                    continue
+                parent[j] = i
+                parent_weight[j] = weight
+
+    return mst, total
+
+
+def prim_matrix(adj_matrix) -> tuple[list[tuple], int]:
+    """Computes the Minimum Spanning Tree (MST) of a dense graph using the array-based Prim's algorithm.
+
+    Instead of a heap, the lightest connecting edge of every vertex is kept in a plain list,
+    and the next vertex is found with a linear scan. That is O(V^2) in total, which is optimal
+    for an adjacency matrix where reading the edges alone already costs O(V^2).
+
+    Args:
+        adj_matrix (list[list[int]]): Adjacency matrix representing the graph.
+            A 0 (except on diagonal) indicates no direct edge.
+
+    Returns:
+        tuple[list[tuple], int]: The MST edges as (u, v, weight) and the total weight, like 'kruskal'.
+    """
+    n = len(adj_matrix)
+    in_tree = [False] * n
+    best = [float('inf')] * n
+    parent = [None] * n
+    mst = []
+    total = 0
+
+    for _ in range(n):
+        u = -1
+        for v in range(n):
+            if not in_tree[v] and (u == -1 or best[v] < best[u]):
+                u = v
+        in_tree[u] = True
+        if parent[u] is not None:
+            mst.append((parent[u], u, best[u]))
+            total += best[u]
+
+        row = adj_matrix[u]
+        for v in range(n):
+            weight = row[v]
+            if weight != 0 and not in_tree[v] and weight < best[v]:
+                best[v] = weight
+                parent[v] = u
+
+    return mst, total
+
+
+def _attach(sources: array, targets: array, weights: list) -> None:
+    """Pool initializer: stores the edge arrays once per worker instead of once per round."""
+    _shared['sources'] = sources
+    _shared['targets'] = targets
+    _shared['weights'] = weights
+
+
+def _cheapest_edges(task: tuple) -> dict[int, int]:
+    """Finds the cheapest edge leaving every component among the edges start..stop-1.
+
+    Args:
+        task (tuple): (labels, start, stop), where labels maps a vertex to its component root.
+
+    Returns:
+        dict[int, int]: The component root mapped to the index of its cheapest outgoing edge.
+    """
+    labels, start, stop = task
+    sources, targets, weights = _shared['sources'], _shared['targets'], _shared['weights']
+    cheapest = {}
+    for e in range(start, stop):
+        comp_u, comp_v = labels[sources[e]], labels[targets[e]]
+        if comp_u == comp_v:
+            continue
+        #  Ties are broken by the edge index, so all components agree on one order and no cycle appears
+        for comp in (comp_u, comp_v):
+            best = cheapest.get(comp)
+            if best is None or (weights[e], e) < (weights[best], best):
+                cheapest[comp] = e
+    return cheapest
+
+
+def boruvka(adj_list, processes=None) -> tuple[list[tuple], int]:
+    """Computes the Minimum Spanning Tree (MST) using Borůvka's algorithm.
+
+    Every round each component picks its cheapest outgoing edge, and all picked edges are added
+    at once, so the number of components at least halves per round. The cheapest-edge search of a
+    round is split into edge ranges that run in a process pool if processes is given.
+
+    Args:
+        adj_list (dict | WeightedGraph | CSRGraph): The undirected graph in any shape
+            accepted by 'as_adjacency'.
+        processes (int | None): The number of worker processes, or 'None' to run in this process.
+
+    Returns:
+        tuple[list[tuple], int]: The MST edges as (u, v, weight) and the total weight, like 'kruskal'.
+    """
+    adj_list = as_adjacency(adj_list)
+    vertices = list(adj_list)
+    order = {vertex: i for i, vertex in enumerate(vertices)}
+
+    sources, targets, weights = array('l'), array('l'), []
+    for u, v, weight in _undirected_edges(adj_list, order).values():
+        sources.append(order[u])
+        targets.append(order[v])
+        weights.append(weight)
+
+    num_edges = len(weights)
+    chunks = max(1, processes or 1)
+    bounds = [(num_edges * c // chunks, num_edges * (c + 1) // chunks) for c in range(chunks)]
+
+    pool = None
+    if processes is None:
+        _attach(sources, targets, weights)
+        search = map
+    else:
+        pool = Pool(processes, initializer=_attach, initargs=(sources, targets, weights))
+        search = pool.map
+
+    components = DisjointSet(len(vertices))
+    mst = []
+    total = 0
+    try:
+        while True:
+            labels = array('l', (components.find(i) for i in range(len(vertices))))
+            cheapest = {}
+            for part in search(_cheapest_edges, [(labels, start, stop) for start, stop in bounds]):
+                for comp, e in part.items():
+                    best = cheapest.get(comp)
+                    if best is None or (weights[e], e) < (weights[best], best):
+                        cheapest[comp] = e
+
+            merged = False
+            for e in dict.fromkeys(cheapest.values()):
+                if components.union(sources[e], targets[e]):
+                    mst.append((vertices[sources[e]], vertices[targets[e]], weights[e]))
+                    total += weights[e]
+                    merged = True
+            if not merged:
+                break
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    return mst, total
+
+
+def test_boruvka_edges_listed_in_one_direction():
+    mst, total = boruvka({'A': {}, 'B': {'A': 1}, 'C': {'B': 2}})
+    assert total == 3 and sorted(mst) == [('B', 'A', 1), ('C', 'B', 2)]
+
+
+def test_prim_matches_kruskal_on_a_forest():
+    from random import Random
+
+    from .kruskal import kruskal
+
+    rng = Random(3)
+    n = 40
+    matrix = [[0] * n for _ in range(n)]
+    for _ in range(90):
+        u, v = rng.randrange(20), rng.randrange(20)  # Vertices 20..39 stay isolated
+        if u != v:
+            matrix[u][v] = matrix[v][u] = rng.randint(1, 50)
+    graph = {u: {v: w for v, w in enumerate(row) if w} for u, row in enumerate(matrix)}
+
+    expected_edges, expected_total = kruskal(graph)
+    for edges, total in (prim(graph), prim(graph, start=7), prim_matrix(matrix), boruvka(graph)):
+        assert total == expected_total and len(edges) == len(expected_edges)
+
+    one_direction = {'A': {}, 'B': {'A': 1}, 'C': {'B': 2}}
+    edges, total = prim(one_direction)
+    assert total == 3 and {frozenset((u, v)) for u, v, _ in edges} == {frozenset('AB'), frozenset('BC')}
+
+
+if __name__ == "__main__":
+    graph = {
+        'A': {'B': 4, 'C': 4},
+        'B': {'A': 4, 'C': 2},
+        'C': {'A': 4, 'B': 2, 'D': 3, 'E': 1, 'F': 6},
+        'D': {'C': 3, 'F': 2},
+        'E': {'C': 1, 'F': 3},
+        'F': {'C': 6, 'D': 2, 'E': 3},
+    }
+    am = [
+        [0, 4, 4, 0, 0, 0],
+        [4, 0, 2, 0, 0, 0],
+        [4, 2, 0, 3, 1, 6],
+        [0, 0, 3, 0, 0, 2],
+        [0, 0, 1, 0, 0, 3],
+        [0, 0, 6, 2, 3, 0]
+    ]
+
+    print("Prim:", prim(graph))
+    print("Prim on matrix:", prim_matrix(am))
+    print("Borůvka:", boruvka(graph))
@@ -0,0 +1,278 @@
+from array import array
+from collections.abc import Iterator
+
+from .graph_implementation import Graph
+
+
+def bfs(graph, start: int, alpha: int = 14, beta: int = 24, directed: bool | None = None) -> dict[int, int]:
+    """Runs a level-synchronous, direction-optimising Breadth-First Search (BFS).
+
+    The search expands one whole level (frontier) at a time and picks a direction per level:
+    - top-down: every frontier vertex visits its neighbours, cheap while the frontier is small,
+    - bottom-up: every unvisited vertex looks for a parent in the frontier, kept as a bitset,
+      and stops at the first one found, cheap once the frontier covers a large part of the graph.
+    The search switches to bottom-up when the frontier has more than 1/alpha of the unexplored edges,
+    and back to top-down when the frontier shrinks below 1/beta of the vertices.
+    Every level only depends on the previous one, so there is no recursion at any depth.
+
+    Args:
+        graph (Graph | DirectedGraph | dict): The graph with vertices 1..n, or its adjacency lists.
+        start (int): The starting vertex.
+        alpha (int): The top-down to bottom-up switching factor.
+        beta (int): The bottom-up to top-down switching factor.
+        directed (bool | None): Whether the edges are one-way, so the bottom-up step needs the
+            reversed adjacency lists. By default only a 'Graph' is taken as undirected, since
+            reversing an undirected dict is merely redundant while skipping it for a directed
+            one would be wrong.
+
+    Returns:
+        dict[int, int]: The level (number of edges from start) of every reachable vertex.
+    """
+    adj_list = getattr(graph, 'graph', graph)
+    n = len(adj_list)
+    in_adj_list = None  # The bottom-up step needs incoming edges, built on first use for directed graphs
+    if directed is None:
+        directed = not isinstance(graph, Graph)
+
+    level = array('l', [-1]) * (n + 1)
+    level[start] = 0
+    frontier = [start]
+    depth = 0
+    unexplored_edges = sum(len(neighbours) for neighbours in adj_list.values())
+    bottom_up = False
+
+    while frontier:
+        frontier_edges = sum(len(adj_list[v]) for v in frontier)
+        unexplored_edges -= frontier_edges
+        if not bottom_up and frontier_edges > unexplored_edges / alpha:
+            bottom_up = True
+        elif bottom_up and len(frontier) < n / beta:
+            bottom_up = False
+
+        depth += 1
+        next_frontier = []
+        if bottom_up:
+            if in_adj_list is None:
+                in_adj_list = _reverse(adj_list) if directed else adj_list
+            in_frontier = bytearray(n + 1)
+            for v in frontier:
+                in_frontier[v] = 1
+            for v in range(1, n + 1):
+                if level[v] < 0:
+                    for u in in_adj_list[v]:
+                        if in_frontier[u]:
+                            level[v] = depth
+                            next_frontier.append(v)
+                            break
+        else:
+            for u in frontier:
+                for v in adj_list[u]:
+                    if level[v] < 0:
+                        level[v] = depth
+                        next_frontier.append(v)
+        frontier = next_frontier
+
+    return {v: level[v] for v in range(1, n + 1) if level[v] >= 0}
+
+
+def dfs(graph, start: int) -> Iterator[int]:
+    """Performs an iterative preorder Depth-First Search (DFS) traversal.
+
+    An explicit stack of (vertex, neighbour iterator) pairs replaces the call stack, so the
+    vertices come in the same order as from the recursive version without its depth limit.
+
+    Args:
+        graph (Graph | DirectedGraph | dict): The graph with vertices 1..n, or its adjacency lists.
+        start (int): The starting vertex.
+
+    Yields:
+        int: The next vertex in the DFS preorder.
+    """
+    adj_list = getattr(graph, 'graph', graph)
+    visited = bytearray(len(adj_list) + 1)
+    visited[start] = 1
+    yield start
+    stack = [iter(adj_list[start])]
+
+    while stack:
+        for v in stack[-1]:
+            if not visited[v]:
+                visited[v] = 1
+                yield v
+                stack.append(iter(adj_list[v]))
+                break
+        else:
+            stack.pop()
+
+
+def connected_components(graph) -> list[list[int]]:
+    """Finds the connected components of an undirected graph.
+
+    Args:
+        graph (Graph | dict): The undirected graph with vertices 1..n, or its adjacency lists.
+
+    Returns:
+        list[list[int]]: The vertices of every component, components in the order of their smallest vertex.
+    """
+    adj_list = getattr(graph, 'graph', graph)
+    visited = bytearray(len(adj_list) + 1)
+    components = []
+
+    for root in range(1, len(adj_list) + 1):
+        if visited[root]:
+            continue
+        visited[root] = 1
+        component = [root]
+        for u in component:  # The list grows while it is iterated, which makes it a BFS queue
+            for v in adj_list[u]:
+                if not visited[v]:
+                    visited[v] = 1
+                    component.append(v)
+        components.append(component)
+
+    return components
+
+
+def strongly_connected_components(graph) -> list[list[int]]:
+    """Finds the strongly connected components of a directed graph with iterative Tarjan's algorithm.
+
+    Every vertex gets a discovery index and a low-link, the smallest index reachable from its DFS
+    subtree through vertices still on the stack. A vertex whose low-link equals its own index is
+    the root of a component, which is then popped from the stack. The DFS uses an explicit stack.
+
+    Args:
+        graph (DirectedGraph | dict): The directed graph with vertices 1..n, or its adjacency lists.
+
+    Returns:
+        list[list[int]]: The vertices of every component, in reverse topological order of the components.
+    """
+    adj_list = getattr(graph, 'graph', graph)
+    n = len(adj_list)
+    index = array('l', [-1]) * (n + 1)
+    low = array('l', [0]) * (n + 1)
+    on_stack = bytearray(n + 1)
+    stack = []
+    components = []
+    counter = 0
+
+    for root in range(1, n + 1):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, iter(adj_list[root]))]
+
+        while work:
+            v, neighbours = work[-1]
+            for w in neighbours:
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    work.append((w, iter(adj_list[w])))
+                    break
+                if on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[v] < low[parent]:
+                        low[parent] = low[v]
+                if low[v] == index[v]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        component.append(w)
+                        if w == v:
+                            break
+                    components.append(component)
+
+    return components
+
+
+def _reverse(adj_list: dict[int, list[int]]) -> dict[int, list[int]]:
+    """Returns the adjacency lists of the graph with every edge reversed."""
+    reverse = {v: [] for v in adj_list}
+    for u, neighbours in adj_list.items():
+        for v in neighbours:
+            reverse[v].append(u)
+    return reverse
+
+
+def test_bfs_on_directed_dict():
+    graph = {1: [2], 2: [3], 3: []}
+    graph.update({v: [2] for v in range(4, 11)})
+    expected = {1: 0, 2: 1, 3: 2}
+    assert bfs(graph, 1) == expected
+    assert bfs(graph, 1, alpha=1) == expected  # Forces the bottom-up step
+    assert bfs(graph, 1, directed=True) == expected
+
+
+def test_strongly_connected_components_match_reachability():
+    from random import Random
+
+    rng = Random(9)
+    for _ in range(30):
+        n = rng.randint(1, 12)
+        graph = {v: [rng.randint(1, n) for _ in range(rng.randint(0, 3))] for v in range(1, n + 1)}
+        reach = {}
+        for v in graph:
+            seen = {v}
+            frontier = [v]
+            while frontier:
+                for w in graph[frontier.pop()]:
+                    if w not in seen:
+                        seen.add(w)
+                        frontier.append(w)
+            reach[v] = seen
+
+        components = strongly_connected_components(graph)
+        position = {v: i for i, component in enumerate(components) for v in component}
+        assert sorted(position) == list(graph)
+        for u in graph:
+            for v in graph:
+                assert (position[u] == position[v]) == (v in reach[u] and u in reach[v])
+            for v in graph[u]:
+                assert position[u] >= position[v]  # Reverse topological order
+
+
+def test_connected_components_of_graph():
+    graph = Graph(7)
+    for v1, v2 in ((1, 4), (4, 6), (2, 5), (6, 1)):
+        graph.add_edge(v1, v2)
+    assert [sorted(component) for component in connected_components(graph)] == [[1, 4, 6], [2, 5], [3], [7]]
+    assert list(dfs(graph, 2)) == [2, 5]
+
+
+def test_long_paths_do_not_recurse():
+    import sys
+
+    n = 20 * sys.getrecursionlimit()
+    path = {v: [v + 1] for v in range(1, n)}
+    path[n] = []
+    assert list(dfs(path, 1)) == list(range(1, n + 1))
+    assert strongly_connected_components(path) == [[v] for v in range(n, 0, -1)]
+
+    path[n].append(1)
+    assert [sorted(component) for component in strongly_connected_components(path)] == [list(range(1, n + 1))]
+
+
+if __name__ == "__main__":
+    from .graph_implementation import DirectedGraph
+
+    graph = Graph(6)
+    for v1, v2 in ((1, 2), (2, 3), (3, 1), (4, 5)):
+        graph.add_edge(v1, v2)
+    print("BFS levels from 1:", bfs(graph, 1))  # {1: 0, 2: 1, 3: 1}
+    print("DFS from 1:", list(dfs(graph, 1)))  # [1, 2, 3]
+    print("Components:", connected_components(graph))  # [[1, 2, 3], [4, 5], [6]]
+
+    directed_graph = DirectedGraph(5)
+    for v1, v2 in ((1, 2), (2, 3), (3, 1), (3, 4), (4, 5), (5, 4)):
+        directed_graph.add_edge(v1, v2)
+    print("SCC:", strongly_connected_components(directed_graph))  # [[5, 4], [3, 2, 1]]
@@ -23,6 +23,16 @@ class WeightedGraphInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def remove_edge(self, vertex1: int, vertex2: int) -> None:
+        """Removes the undirected edge between two given vertices.
+
+        Args:
+            vertex1 (int): The first given vertex.
+            vertex2 (int): The second given vertex.
+        """
+        pass
+
     @abstractmethod
     def is_adjacent(self, vertex1: int, vertex2: int) -> bool:
         """Checks if the given vertex2 is adjacent to the given vertex1.
@@ -54,11 +64,18 @@ class WeightedGraphInterface(ABC):
 
 
 class WeightedGraph(WeightedGraphInterface):
-    """Represents weighted graph."""
+    """Represents weighted graph.
+
+    Every vertex maps to a dictionary of its neighbours and the weights of the edges to them,
+    so looking up, updating or removing a single edge does not depend on the vertex degree.
+    'version' is increased by every change of the edges, so results computed from the graph
+    (e.g. in 'ShortestPathCache') can tell that they are outdated.
+    """
     def __init__(self, num_vertices: int) -> None:
         """Initializes weighted graph with finite given number of vertices."""
         super().__init__(num_vertices)
-        self.graph: dict = {i: [] for i in range(1, num_vertices + 1)}
+        self.graph: dict[int, dict[int, int]] = {i: {} for i in range(1, num_vertices + 1)}
+        self.version = 0
 
     def add_edge(self, vertex1: int, vertex2: int, weight: int) -> None:
         """Sets an undirected weighted edge between vertex1 and vertex2.
@@ -71,23 +88,64 @@ class WeightedGraph(WeightedGraphInterface):
             vertex2 (int): The second given vertex.
             weight (int): The weight of the edge between vertex1 and vertex2.
 
+        Raises:
+            KeyError: If the vertex1 or the vertex2 is not in the graph.
+        """
+        self.check_miss_vert(vertex1, vertex2)
+
+        self.graph[vertex1][vertex2] = weight
+        self.graph[vertex2][vertex1] = weight
+        self.version += 1
+
+    @classmethod
+    def from_edges(cls, num_vertices: int, edges) -> 'WeightedGraph':
+        """Builds a weighted graph from many edges at once.
+
+        The vertices are checked once for the whole batch instead of once per edge, and
+        the neighbour dictionaries are filled directly. A later edge between the same
+        vertices replaces the earlier one, like with 'add_edge'.
+
+        Args:
+            num_vertices (int): The number of vertices.
+            edges (Iterable[tuple[int, int, int]]): The (vertex1, vertex2, weight) edges,
+                e.g. a list, a generator or a NumPy array of shape (E, 3).
+
         Returns:
-            None: If the vertex1 or the vertex2 is not in the graph.
+            WeightedGraph: The built graph.
+
+        Raises:
+            KeyError: If an edge refers to a vertex that is not in the graph.
         """
+        if hasattr(edges, 'tolist'):  # A NumPy array, converted by column instead of by row
+            edges = zip(edges[:, 0].astype(int).tolist(), edges[:, 1].astype(int).tolist(), edges[:, 2].tolist())
+
+        weighted_graph = cls(num_vertices)
+        graph = weighted_graph.graph
         try:
-            self.check_miss_vert(vertex1, vertex2)
-        except KeyError as e:
-            # raise Exception(f"{vertex1} or {vertex2} does not exist in the graph.") from e
-            print(str(e))
-            return
+            for vertex1, vertex2, weight in edges:
+                graph[vertex1][vertex2] = weight
+                graph[vertex2][vertex1] = weight
+        except KeyError:
+            weighted_graph.check_miss_vert(vertex1, vertex2)
+            raise
+        weighted_graph.version += 1
+        return weighted_graph
+
+    def remove_edge(self, vertex1: int, vertex2: int) -> None:
+        """Removes the undirected edge between vertex1 and vertex2 if it exists.
 
-        existing_edge = next((edge for edge in self.graph[vertex1] if edge[0] == vertex2), None)
-        if existing_edge:
-            self.graph[vertex1].remove(existing_edge)
-            self.graph[vertex2].remove((vertex1, existing_edge[1]))
+        Args:
+            vertex1 (int): The first given vertex.
+            vertex2 (int): The second given vertex.
 
-        self.graph[vertex1].append((vertex2, weight))
-        self.graph[vertex2].append((vertex1, weight))
+        Raises:
+            KeyError: If the vertex1 or the vertex2 is not in the graph.
+        """
+        self.check_miss_vert(vertex1, vertex2)
+
+        if self.graph[vertex1].pop(vertex2, None) is not None:
+            self.graph[vertex2].pop(vertex1, None)
+            self.version += 1
 
     def is_adjacent(self, vertex1: int, vertex2: int) -> bool | None:
         """Checks that vertex2 is adjacent to vertex1.
@@ -107,7 +165,7 @@ class WeightedGraph(WeightedGraphInterface):
             print(str(e))
             return
 
-        return any(neighbour == vertex2 for neighbour, _ in self.graph.get(vertex1, []))
+        return vertex2 in self.graph[vertex1]
 
     def return_adjacent(self, vertex: int) -> list[tuple[int, int]] | None:
         """Returns all adjacent vertices to the given vertex.
@@ -126,7 +184,7 @@ class WeightedGraph(WeightedGraphInterface):
             print(str(e))
             return
 
-        return self.graph[vertex]
+        return list(self.graph[vertex].items())
 
     def get_path_weight(self, *path: int) -> int | None:
         """Calculates the total weight of a given path in the graph.
@@ -152,11 +210,10 @@ class WeightedGraph(WeightedGraphInterface):
         total_path_weight = 0
         for i in range(len(path) - 1):
             vertex1, vertex2 = path[i], path[i+1]
-            existing_edge = next((edge for edge in self.graph[vertex1] if edge[0] == vertex2), None)
-            if existing_edge:
-                total_path_weight += existing_edge[1]
-            else:
+            weight = self.graph[vertex1].get(vertex2)
+            if weight is None:
                 return -1
+            total_path_weight += weight
         return total_path_weight
 
     def check_miss_vert(self, *vertices: int) -> None:
@@ -176,6 +233,30 @@ class WeightedGraph(WeightedGraphInterface):
                            f"{len(self.graph)} vertices.")
 
 
+def test_edge_updates_raise_on_missing_vertex():
+    graph = WeightedGraph(num_vertices=3)
+    graph.add_edge(1, 2, 5)
+    for update in (lambda: graph.add_edge(1, 4, 1), lambda: graph.remove_edge(4, 1)):
+        try:
+            update()
+        except KeyError:
+            pass
+        else:
+            raise AssertionError("A missing vertex must raise KeyError.")
+
+    graph.remove_edge(1, 2)
+    assert not graph.is_adjacent(1, 2) and graph.version == 2
+
+
+def test_from_edges_numpy_array():
+    import pytest
+
+    np = pytest.importorskip('numpy')
+    graph = WeightedGraph.from_edges(3, np.array([[1.0, 2.0, 0.5], [2.0, 3.0, 4.0]]))
+    assert graph.graph == {1: {2: 0.5}, 2: {1: 0.5, 3: 4.0}, 3: {2: 4.0}}
+    assert all(type(v) is int for v in graph.graph[2])
+
+
 if __name__ == "__main__":
     """> 5      # Total num of vertices
        > 2      # Num of edges to add
@@ -184,9 +265,10 @@ if __name__ == "__main__":
        > 1 2 3  # Path
        28
     """
-    graph = WeightedGraph(num_vertices=int(input("Enter num of vertices: ")))
-    for i in range(int(input("Enter number of edges: "))):
-        v1, v2, w = map(int, input(f"Enter {i+1}{'st' if i == 0 else 'nd' if i == 1 else 'rd' if i == 2 else 'th'} "
-                                   f"edge: ").split())
-        graph.add_edge(vertex1=v1, vertex2=v2, weight=w)
+    num_vertices = int(input("Enter num of vertices: "))
+    graph = WeightedGraph.from_edges(num_vertices, (
+        map(int, input(f"Enter {i+1}{'st' if i == 0 else 'nd' if i == 1 else 'rd' if i == 2 else 'th'} "
+                       f"edge: ").split())
+        for i in range(int(input("Enter number of edges: ")))
+    ))
     print(graph.get_path_weight(*map(int, input("Enter the path to get path weight: ").split())))
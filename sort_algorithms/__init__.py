@@ -0,0 +1,44 @@
+"""Sorting and string search algorithms.
+
+The submodules are imported on first access, so 'import sort_algorithms' stays cheap.
+No submodule reads stdin or prints on import, the demos run with 'python -m sort_algorithms.<module>'.
+"""
+from importlib import import_module
+
+_SUBMODULES = frozenset({
+    'counting_sort',
+    'quick_sort',
+    'rabin_karp_algorithm',
+    'radix_sort',
+    'shell_sort',
+})
+
+
+def __getattr__(name: str):
+    """Imports a submodule the first time it is accessed as an attribute of the package."""
+    if name in _SUBMODULES:
+        return import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _SUBMODULES)
+
+
+def test_import_budget():
+    """Importing every submodule in a fresh interpreter with stdin closed must be quiet and fast."""
+    import subprocess
+    import sys
+    import time
+    from pathlib import Path
+
+    lazy = "import sys, sort_algorithms; assert not [m for m in sys.modules if m.startswith('sort_algorithms.')]"
+    eager = "import sort_algorithms; " + "; ".join(f"sort_algorithms.{name}" for name in sorted(_SUBMODULES))
+    for code, budget in ((lazy, 0.5), (eager, 5.0)):
+        begin = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parent.parent,
+                                stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=60)
+        elapsed = time.perf_counter() - begin
+        assert result.returncode == 0, result.stderr
+        assert result.stdout == "" and result.stderr == ""
+        assert elapsed < budget, f"Importing took {elapsed:.2f} s, the budget is {budget} s."
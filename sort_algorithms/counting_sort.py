@@ -1,4 +1,3 @@
-import pytest
 from random import randint
 
 
@@ -48,4 +47,6 @@ def test_counting_sort():
 
 
 if __name__ == "__main__":
+    import pytest
+
     pytest.main()
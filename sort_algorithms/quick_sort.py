@@ -1,4 +1,3 @@
-import pytest
 from random import randint
 
 
@@ -78,4 +77,6 @@ def test_quick_sort():
 
 
 if __name__ == "__main__":
+    import pytest
+
     pytest.main()
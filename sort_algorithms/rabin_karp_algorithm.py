@@ -71,11 +71,11 @@ def rabin_karp(text, pattern, base=256, prime=101) -> list:
     return occurrences
 
 
-# example usage
-text = "CODEWITHCODER"
-pattern = input()
-occurrences = rabin_karp(text, pattern)
-if occurrences:
-    print(f"The pattern found at indices: {occurrences}.")
-else:
-    print(f"The pattern is not present in the text.")
+if __name__ == "__main__":
+    text = "CODEWITHCODER"
+    pattern = input()
+    occurrences = rabin_karp(text, pattern)
+    if occurrences:
+        print(f"The pattern found at indices: {occurrences}.")
+    else:
+        print(f"The pattern is not present in the text.")
@@ -32,6 +32,7 @@ def radix_sort(lst):
         place *= 10
 
 
-data = list(map(int, input().split()))
-radix_sort(data)
-print(data)
+if __name__ == "__main__":
+    data = list(map(int, input().split()))
+    radix_sort(data)
+    print(data)
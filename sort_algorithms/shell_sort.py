@@ -16,6 +16,7 @@ def shell_sort(lst):
         interval //= 2
 
 
-data = list(map(int, input().split()))
-shell_sort(data)
-print(data)
+if __name__ == "__main__":
+    data = list(map(int, input().split()))
+    shell_sort(data)
+    print(data)